@@ -1,9 +1,27 @@
 """AI agent implementations for companions."""
 
-from typing import Dict, Any, Optional
+import asyncio
+from typing import Dict, Any, Optional, Callable
 from .base import Companion
 from ..utils.api_clients import OpenAIClient, ClaudeClient
 
+# Tools that only read game state or query external data; when the model
+# asks for several of these in one turn they are run concurrently
+_READ_ONLY_TOOLS = frozenset({
+    "check_relationship_affinity",
+    "query_character_memory",
+    "check_story_progress",
+    "should_trigger_event",
+    "check_ending_readiness",
+    "query_other_companion",
+    "analyze_player_sentiment",
+    "check_room_progress",
+    "get_ending_prediction",
+    "get_historical_weather",
+    "search_web_archive",
+    "fetch_traffic_data",
+})
+
 
 class OpenAICompanion(Companion):
     """Autonomous companion powered by OpenAI with MCP tools."""
@@ -25,12 +43,20 @@ class OpenAICompanion(Companion):
         self.mcp_client = mcp_client  # REAL MCP CLIENT
         self.tool_use_history = []  # Track tool usage for reasoning display
 
-    async def respond(self, message: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def reset(self) -> None:
+        """Forget memories, relationships and tool usage; keep the API client."""
+        super().reset()
+        self.tool_use_history = []
+
+    async def respond(self, message: str, context: Optional[Dict[str, Any]] = None, on_token: Optional[Callable[[Optional[str]], None]] = None) -> Dict[str, Any]:
         """Generate an autonomous response using OpenAI with MCP tools.
 
         Args:
             message: The input message
             context: Additional context for the response
+            on_token: Optional callback receiving response text deltas as they stream;
+                called with None when a round after a tool call starts, since any
+                text streamed before the tools ran is not the final reply
 
         Returns:
             Dictionary with 'response' and 'tool_calls_made'
@@ -66,6 +92,8 @@ class OpenAICompanion(Companion):
 
         while iteration < max_iterations:
             iteration += 1
+            if on_token is not None and iteration > 1:
+                on_token(None)
 
             # Generate response (agent decides whether to use tools)
             result = await self.client.generate_response(
@@ -73,7 +101,8 @@ class OpenAICompanion(Companion):
                 system_prompt=system_prompt,
                 temperature=0.8,
                 tools=tools,
-                tool_choice="auto"  # Agent decides autonomously
+                tool_choice="auto",  # Agent decides autonomously
+                on_token=on_token
             )
 
             # If no tool calls, we have final response
@@ -81,14 +110,25 @@ class OpenAICompanion(Companion):
                 final_response = result["content"]
                 break
 
-            # Agent decided to use tools - execute them via MCP CLIENT
-            for tool_call in result["tool_calls"]:
+            # Agent decided to use tools - execute them via MCP CLIENT (real MCP protocol!)
+            calls = [(tool_call, json.loads(tool_call["arguments"])) for tool_call in result["tool_calls"]]
+            if len(calls) > 1 and all(tool_call["name"] in _READ_ONLY_TOOLS for tool_call, _ in calls):
+                # Independent lookups - run them together. Collect failures per
+                # call and raise the first in call order, so errors surface as
+                # the same single exception the sequential path raises
+                tool_results = await asyncio.gather(
+                    *(self.mcp_client.call_tool(tool_call["name"], tool_args) for tool_call, tool_args in calls),
+                    return_exceptions=True
+                )
+                for tool_result in tool_results:
+                    if isinstance(tool_result, BaseException):
+                        raise tool_result
+            else:
+                # State-changing tools run in the order the agent chose
+                tool_results = [await self.mcp_client.call_tool(tool_call["name"], tool_args) for tool_call, tool_args in calls]
+
+            for (tool_call, tool_args), tool_result in zip(calls, tool_results):
                 tool_name = tool_call["name"]
-                tool_args = json.loads(tool_call["arguments"])
-
-                # Execute tool via MCP CLIENT (real MCP protocol!)
-                import asyncio
-                tool_result = await self.mcp_client.call_tool(tool_name, tool_args)
 
                 # Track for UI display
                 tool_calls_made.append({
@@ -352,12 +392,13 @@ class ClaudeCompanion(Companion):
         self.api_key = api_key
         # TODO: Initialize Anthropic client
 
-    async def respond(self, message: str, context: Optional[Dict[str, Any]] = None) -> str:
+    async def respond(self, message: str, context: Optional[Dict[str, Any]] = None, on_token: Optional[Callable[[Optional[str]], None]] = None) -> str:
         """Generate a response using Claude.
 
         Args:
             message: The input message
             context: Additional context for the response
+            on_token: Unused until the Anthropic client is wired up
 
         Returns:
             The companion's response
@@ -1,7 +1,7 @@
 """Base companion class."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
 from ..game_mcp.memory import CharacterMemory
 
 
@@ -24,13 +24,20 @@ class Companion(ABC):
         self.memory = CharacterMemory(companion_id)
         self.relationships: Dict[str, float] = {}  # companion_id -> affinity score
 
+    def reset(self) -> None:
+        """Forget memories and relationships (start of a new playthrough)."""
+        self.memory = CharacterMemory(self.companion_id)
+        self.relationships = {}
+
     @abstractmethod
-    async def respond(self, message: str, context: Optional[Dict[str, Any]] = None) -> str:
+    async def respond(self, message: str, context: Optional[Dict[str, Any]] = None, on_token: Optional[Callable[[Optional[str]], None]] = None) -> str:
         """Generate a response to a message.
 
         Args:
             message: The input message
             context: Additional context for the response
+            on_token: Optional callback receiving response text deltas as they stream
+                (None when a new model round starts and earlier text is superseded)
 
         Returns:
             The companion's response
@@ -249,8 +249,8 @@ class InProcessMCPServer:
             # Get MCPTools instance
             mcp_tools = MCPTools(self.game_state)
 
-            # Execute the tool
-            result = mcp_tools.call_tool(name, arguments)
+            # Execute the tool without blocking the UI event loop
+            result = await mcp_tools.call_tool_async(name, arguments)
 
             # Return as TextContent per MCP spec
             return [TextContent(
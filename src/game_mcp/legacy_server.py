@@ -169,8 +169,8 @@ class EchoHeartsMCPServer:
             # Get MCPTools instance from game state
             mcp_tools = MCPTools(self.game_state)
 
-            # Execute the tool
-            result = mcp_tools.call_tool(name, arguments)
+            # Execute the tool on this server's running loop
+            result = await mcp_tools.call_tool_async(name, arguments)
 
             # Return as TextContent
             return [TextContent(
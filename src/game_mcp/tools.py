@@ -620,9 +620,6 @@ Affinity change scale:
         Returns:
             Current room information and objectives
         """
-        if not hasattr(self.game_state, 'room_progression'):
-            return {"error": "Room progression system not initialized"}
-
         return self.game_state.room_progression.get_progress_summary()
 
     def check_puzzle_trigger(self, player_message: str) -> Dict[str, Any]:
@@ -641,9 +638,6 @@ Affinity change scale:
         Returns:
             Whether puzzle is complete and unlock is allowed
         """
-        if not hasattr(self.game_state, 'room_progression'):
-            return {"error": "Room progression system not initialized"}
-
         from ..story.puzzles import (
             validate_room1_answer,
             validate_room2_password,
@@ -818,9 +812,6 @@ Affinity change scale:
         Returns:
             Success status and next room info
         """
-        if not hasattr(self.game_state, 'room_progression'):
-            return {"error": "Room progression system not initialized"}
-
         current_room = self.game_state.room_progression.get_current_room()
         room_num = current_room.room_number
 
@@ -979,9 +970,6 @@ You step into a vast chamber. Three doors stand before you, each glowing with a
         Returns:
             Confirmation of recorded choice
         """
-        if not hasattr(self.game_state, 'room_progression'):
-            return {"error": "Room progression system not initialized"}
-
         # Map choice types to key_choices format
         if choice_type == "sacrifice_echo":
             self.game_state.room_progression.record_choice("sacrificed_ai", "echo")
@@ -1012,10 +1000,7 @@ You step into a vast chamber. Three doors stand before you, each glowing with a
 
         echo_affinity = self.game_state.relationships.get_relationship("player", "echo")
 
-        if hasattr(self.game_state, 'room_progression'):
-            key_choices = self.game_state.room_progression.key_choices
-        else:
-            key_choices = {}
+        key_choices = self.game_state.room_progression.key_choices
 
         prediction = determine_ending_from_relationships(
             echo_affinity,
@@ -1041,7 +1026,7 @@ You step into a vast chamber. Three doors stand before you, each glowing with a
         Returns:
             Weather data for the specified date/time/location
         """
-        if not hasattr(self.game_state, 'weather_mcp_client') or self.game_state.weather_mcp_client is None:
+        if self.game_state.weather_mcp_client is None:
             return {"error": "Weather MCP client not initialized"}
 
         try:
@@ -1070,7 +1055,7 @@ You step into a vast chamber. Three doors stand before you, each glowing with a
         Returns:
             Archived web content
         """
-        if not hasattr(self.game_state, 'web_mcp_client') or self.game_state.web_mcp_client is None:
+        if self.game_state.web_mcp_client is None:
             return {"error": "Web MCP client not initialized"}
 
         try:
@@ -1093,7 +1078,7 @@ You step into a vast chamber. Three doors stand before you, each glowing with a
         Returns:
             Traffic safety data
         """
-        if not hasattr(self.game_state, 'web_mcp_client') or self.game_state.web_mcp_client is None:
+        if self.game_state.web_mcp_client is None:
             return {"error": "Web MCP client not initialized"}
 
         try:
@@ -1117,8 +1102,11 @@ You step into a vast chamber. Three doors stand before you, each glowing with a
         except Exception as e:
             return {"error": f"Failed to fetch traffic data: {str(e)}"}
 
-    def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Call a tool by name.
+    async def call_tool_async(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a tool by name from a running event loop.
+
+        Async tools are awaited on the caller's loop; sync tools (which may do
+        blocking I/O, e.g. sentiment analysis) run in a worker thread.
 
         Args:
             tool_name: Name of the tool
@@ -1127,27 +1115,21 @@ You step into a vast chamber. Three doors stand before you, each glowing with a
         Returns:
             Tool result
         """
+        import asyncio
+        import inspect
         import logging
         logger = logging.getLogger(__name__)
 
-        logger.info(f"[TOOL CALL DEBUG] Attempting to call tool: {tool_name} with args: {arguments}")
-        logger.info(f"[TOOL CALL DEBUG] Available methods on MCPTools: {[m for m in dir(self) if not m.startswith('_')]}")
-
         method = getattr(self, tool_name, None)
         if not method:
             logger.error(f"[TOOL CALL DEBUG] Tool {tool_name} not found on MCPTools instance")
             return {"error": f"Tool {tool_name} not found"}
 
-        logger.info(f"[TOOL CALL DEBUG] Found method: {method}")
-
         try:
-            # Handle async methods
-            import asyncio
-            import inspect
             if inspect.iscoroutinefunction(method):
-                result = asyncio.run(method(**arguments))
+                result = await method(**arguments)
             else:
-                result = method(**arguments)
+                result = await asyncio.to_thread(method, **arguments)
             logger.info(f"[TOOL CALL DEBUG] Tool {tool_name} returned: {result}")
             return result
         except Exception as e:
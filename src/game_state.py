@@ -3,7 +3,9 @@
 import asyncio
 import logging
 import os
-from typing import Dict, List, Optional, Tuple
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
 from .game_mcp.in_process_mcp import InProcessMCPServer, InProcessMCPClient
 from .game_mcp.weather_mcp_client import MockWeatherMCPClient, connect_to_weather_mcp
 from .game_mcp.web_mcp_client import MockWebMCPClient, connect_to_web_mcp
@@ -30,16 +32,19 @@ class GameState:
         """
         self.session_id = session_id
         self.companions: Dict[str, OpenAICompanion] = {}
-        self.conversation = ConversationHistory(session_id)
-        self.relationships = RelationshipTracker()
 
-        # NEW: Room-based progression system
-        self.room_progression = RoomProgression()
+        # Per-playthrough state: conversation, relationships, rooms, UI caches
+        self._init_playthrough()
 
         # REAL MCP Architecture: Server and Client
         self.mcp_server = InProcessMCPServer(self, name=f"echo-hearts-{session_id}")
         self.mcp_client = InProcessMCPClient(self.mcp_server)
         self._mcp_initialized = False
+        # Serializes MCP setup between warm-up, chat turns and the weather terminal
+        self._mcp_init_lock = asyncio.Lock()
+        self._warmup_task: Optional[asyncio.Task] = None
+        # Chat turns and puzzle steps currently running against this state
+        self._active_turns = 0
 
         # Weather MCP for historical weather data (Room 1 & 2 puzzles)
         self.weather_mcp_client = None
@@ -49,32 +54,105 @@ class GameState:
         self.web_mcp_client = None
         self._web_mcp_initialized = False
 
-        # Voice service for Echo's speech
-        self.voice_service = EchoVoiceService()
+        # Voice service for Echo's speech (created on first use)
+        self._voice_service: Optional[EchoVoiceService] = None
         self.voice_enabled = True  # User can toggle this
 
+        # Initialize default companions
+        self._initialize_companions()
+
+    def _init_playthrough(self):
+        """Create the state that belongs to one playthrough (everything reset() clears)."""
+        self.conversation = ConversationHistory(self.session_id)
+        self.relationships = RelationshipTracker()
+        # Sidebar markdown for relationships, re-rendered by update_affinity()
+        self.relationships_markdown = self._render_relationships_md()
+
+        # NEW: Room-based progression system
+        self.room_progression = RoomProgression()
+
         # Echo's current expression (for dynamic avatar display)
         self.echo_expression = "neutral"  # Default expression
 
-        # Initialize default companions
-        self._initialize_companions()
+        # Bumped whenever a message may have changed relationships/progression
+        # (lets the UI reuse sidebar markdown between unchanged renders)
+        self.state_version = 0
+        self._ui_cache: Dict[str, Tuple] = {}  # Sidebar markdown per section: (state_version, text)
+
+        # Sidebar markdown last sent to the browser (kept by EchoHeartsUI._sidebar)
+        self._last_rel_md: Optional[str] = None
+        self._last_progress_md: Optional[str] = None
+
+    def reset(self, session_id: str):
+        """Start a fresh playthrough, keeping the OpenAI/MCP/voice clients.
+
+        Args:
+            session_id: New session identifier
+        """
+        self.session_id = session_id
+        self._init_playthrough()
+
+        for companion in self.companions.values():
+            companion.reset()
+        if "echo" in self.companions:
+            self.update_affinity("echo", 0.0)
+
+    @contextmanager
+    def in_use(self):
+        """Mark this state busy for the duration of a turn, so the pool won't recycle it."""
+        self._active_turns += 1
+        try:
+            yield self
+        finally:
+            self._active_turns -= 1
+
+    @property
+    def busy(self) -> bool:
+        """Whether a turn or the background MCP warm-up is still using this state."""
+        warming_up = self._warmup_task is not None and not self._warmup_task.done()
+        return self._active_turns > 0 or warming_up
+
+    @property
+    def voice_service(self) -> EchoVoiceService:
+        """ElevenLabs voice service, created lazily on first speech request."""
+        if self._voice_service is None:
+            self._voice_service = EchoVoiceService()
+        return self._voice_service
+
+    def start_warmup(self):
+        """Start MCP initialization in the background so the first message doesn't wait for it.
+
+        Must be called from the running event loop; no-op once started or initialized.
+        """
+        if self._warmup_task is None and not self._mcp_initialized:
+            self._warmup_task = asyncio.get_running_loop().create_task(self._warmup())
+
+    async def _warmup(self):
+        """Background MCP initialization started by start_warmup()."""
+        await self._initialize_mcp()
 
     async def _initialize_mcp(self):
-        """Initialize all MCP client connections."""
-        await self.mcp_client.initialize()
-        logger.info(f"[MCP] Game MCP server initialized with {len(self.mcp_client.available_tools)} tools")
-
-        # Initialize Weather MCP
-        if not self._weather_mcp_initialized:
-            self.weather_mcp_client = await connect_to_weather_mcp()
-            self._weather_mcp_initialized = True
-            logger.info("[WEATHER_MCP] Weather MCP client initialized")
-
-        # Initialize Web MCP
-        if not self._web_mcp_initialized:
-            self.web_mcp_client = await connect_to_web_mcp()
-            self._web_mcp_initialized = True
-            logger.info("[WEB_MCP] Web MCP client initialized")
+        """Initialize all MCP client connections (once; concurrent callers wait for the first)."""
+        async with self._mcp_init_lock:
+            if self._mcp_initialized:
+                return
+
+            await self.mcp_client.initialize()
+            logger.info(f"[MCP] Game MCP server initialized with {len(self.mcp_client.available_tools)} tools")
+
+            # Initialize Weather MCP
+            if not self._weather_mcp_initialized:
+                self.weather_mcp_client = await connect_to_weather_mcp()
+                self._weather_mcp_initialized = True
+                logger.info("[WEATHER_MCP] Weather MCP client initialized")
+
+            # Initialize Web MCP
+            if not self._web_mcp_initialized:
+                self.web_mcp_client = await connect_to_web_mcp()
+                self._web_mcp_initialized = True
+                logger.info("[WEB_MCP] Web MCP client initialized")
+
+            self._mcp_initialized = True
 
     def _initialize_companions(self):
         """Initialize default companion character."""
@@ -96,22 +174,39 @@ class GameState:
         self.companions["echo"] = companion
 
         # Initialize relationship with player
-        self.relationships.update_relationship("player", "echo", 0.0)
+        self.update_affinity("echo", 0.0)
 
-    async def process_message(self, message: str, companion_id: str = "echo") -> Tuple[str, Optional[MemoryFragment], Optional[str], List]:
+    async def process_message(self, message: str, companion_id: str = "echo", on_token: Optional[Callable[[Optional[str]], None]] = None) -> Tuple[str, Optional[MemoryFragment], Optional[str], List]:
         """Process a user message and get autonomous companion response.
 
         Args:
             message: User's message
             companion_id: Which companion to respond
+            on_token: Optional callback receiving the companion's reply text as it
+                streams (None marks a new model round that replaces earlier text)
 
         Returns:
             Tuple of (response, new_memory_fragment, ending_narrative, tool_calls_made)
         """
+        with self.in_use():
+            try:
+                return await self._process_message(message, companion_id, on_token)
+            finally:
+                self.state_version += 1
+
+    async def _process_message(self, message: str, companion_id: str, on_token: Optional[Callable[[Optional[str]], None]]) -> Tuple[str, Optional[MemoryFragment], Optional[str], List]:
+        """Run one message through puzzle checks, the companion and relationship updates."""
+        # Finish any background warm-up before falling back to lazy initialization
+        if self._warmup_task is not None:
+            try:
+                await self._warmup_task
+            except Exception as e:
+                logger.warning(f"[MCP] Background warm-up failed, retrying inline: {e}")
+            self._warmup_task = None
+
         # Initialize MCP on first message (lazy initialization)
         if not self._mcp_initialized:
             await self._initialize_mcp()
-            self._mcp_initialized = True
 
         # Add message to conversation history
         self.conversation.add_message("User", message)
@@ -228,7 +323,7 @@ class GameState:
         }
 
         # Generate AUTONOMOUS response (agent makes own decisions using MCP tools)
-        result = await companion.respond(message, context=room_context)
+        result = await companion.respond(message, context=room_context, on_token=on_token)
 
         # Clear scenario AFTER companion has used it
         if last_scenario:
@@ -261,12 +356,7 @@ class GameState:
             reason = "conversation (default)"
             logger.info(f"[SENTIMENT DEBUG] No sentiment analysis found - using default. sentiment_result={sentiment_result}")
 
-        self.relationships.update_relationship(
-            "player",
-            companion_id,
-            affinity_change,
-            reason=reason
-        )
+        self.update_affinity(companion_id, affinity_change, reason=reason)
 
         # Update Echo's expression based on sentiment and context
         self._update_echo_expression(sentiment_result, current_room, affinity_change)
@@ -387,6 +477,35 @@ class GameState:
             for comp_id, companion in self.companions.items()
         ]
 
+    def update_affinity(self, companion_id: str, change: float, reason: Optional[str] = None) -> float:
+        """Change the player's affinity with a companion and refresh the sidebar markdown.
+
+        Args:
+            companion_id: Companion whose affinity changes
+            change: Change in affinity
+            reason: Optional reason recorded in the relationship history
+
+        Returns:
+            New affinity value
+        """
+        affinity = self.relationships.update_relationship("player", companion_id, change, reason=reason)
+        self.relationships_markdown = self._render_relationships_md()
+        return affinity
+
+    def _render_relationships_md(self) -> str:
+        """Render the player's relationships as sidebar markdown."""
+        relationships = self.get_relationships_summary()
+        if not relationships:
+            return "*No relationships yet*"
+
+        companions = self.companions
+        get_description = self.relationships.get_relationship_description
+        return "\n".join(
+            f"**{companions[companion_id].name}:** {get_description(affinity)} ({affinity:+.2f})"
+            for companion_id, affinity in relationships.items()
+            if companion_id in companions
+        )
+
     def get_relationships_summary(self) -> Dict[str, float]:
         """Get player relationships with all companions.
 
@@ -405,6 +524,10 @@ class GameState:
         state['mcp_server'] = None
         state['mcp_client'] = None
         state['companions'] = {}  # Will be recreated
+        state['_voice_service'] = None  # Recreated lazily on next use
+        state['_warmup_task'] = None
+        state['_active_turns'] = 0
+        state['_mcp_init_lock'] = None
         return state
 
     def __setstate__(self, state):
@@ -414,6 +537,57 @@ class GameState:
         # Recreate MCP infrastructure
         self.mcp_server = InProcessMCPServer(self, name=f"echo-hearts-{self.session_id}")
         self.mcp_client = InProcessMCPClient(self.mcp_server)
+        self._mcp_initialized = False
+        self._mcp_init_lock = asyncio.Lock()
 
         # Recreate companions
-        self._initialize_companions()
\ No newline at end of file
+        self._initialize_companions()
+
+
+class GameStatePool:
+    """Bounded pool of finished GameState objects, recycled with their clients intact."""
+
+    def __init__(self, max_size: int = 16):
+        """Initialize an empty pool.
+
+        Args:
+            max_size: Maximum number of idle game states kept for reuse
+        """
+        self.max_size = max_size
+        self._idle: List[GameState] = []
+        self._lock = threading.Lock()
+
+    def acquire(self, session_id: str) -> GameState:
+        """Get a game state for a new session, reusing an idle one when available.
+
+        Args:
+            session_id: Unique session identifier
+
+        Returns:
+            GameState ready for a new playthrough
+        """
+        with self._lock:
+            game_state = self._idle.pop() if self._idle else None
+
+        if game_state is None:
+            return GameState(session_id)
+
+        game_state.reset(session_id)
+        return game_state
+
+    def release(self, game_state: GameState):
+        """Return a game state whose session has ended.
+
+        A state that is still busy is left to the garbage collector instead:
+        the next acquire() would reset it under the running turn.
+
+        Args:
+            game_state: Game state no longer referenced by any session
+        """
+        if game_state.busy:
+            logger.debug(f"[POOL] Not recycling busy game state {game_state.session_id}")
+            return
+
+        with self._lock:
+            if len(self._idle) < self.max_size and game_state not in self._idle:
+                self._idle.append(game_state)
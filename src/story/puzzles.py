@@ -4,6 +4,47 @@ from typing import Dict, Any, Optional
 import re
 
 
+# Accepted answers, built once instead of per validation call
+_ROOM1_ANSWERS = ("heavy rain", "heavy rainfall", "torrential rain", "storm", "downpour", "intense rain")
+
+_ROOM2_PASSWORDS = frozenset({
+    "ALEXCHEN_MAY12_2022",
+    "ALEXCHEN_MAY_12_2022",
+    "ALEX_CHEN_MAY_12_2022",
+    "ALEXCHEN_MAY122022",
+})
+
+# Keywords indicating correct understanding
+_ROOM3_KEYWORDS = (
+    "unavoidable",
+    "not my fault",
+    "not your fault",
+    "couldn't prevent",
+    "couldn't stop",
+    "no fault",
+    "accident was unavoidable",
+    "nothing you could do",
+    "nothing i could do",
+)
+
+_ROOM4_ORDERS = frozenset({
+    "LOSS_GRIEF_CREATION_OBSESSION_CYCLE",
+    "1_2_3_4_5",  # If using numbers
+    "ACCIDENT_GRIEF_BUILD_OBSESSION_LOOP",  # Alternative wording
+})
+
+_PASSWORD_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r"PASSWORD\s+IS\s+([A-Z0-9_]+)",
+    r"CODE\s+IS\s+([A-Z0-9_]+)",
+    r"PASSWORD:\s*([A-Z0-9_]+)",
+    r"ENTER\s+([A-Z0-9_]+)",
+))
+_PASSWORD_TOKEN_RE = re.compile(r"([A-Z0-9_]{10,})")
+_TIMELINE_START_RE = re.compile(r"1\.|FIRST")
+_TIMELINE_WORD_RE = re.compile(r"([A-Z]+)")
+_TIMELINE_EVENTS = ("LOSS", "GRIEF", "CREATION", "OBSESSION", "CYCLE")
+
+
 def validate_room1_answer(player_answer: str) -> bool:
     """Validate Room 1 weather puzzle answer.
 
@@ -14,8 +55,7 @@ def validate_room1_answer(player_answer: str) -> bool:
         True if answer is correct
     """
     answer_lower = player_answer.lower().strip()
-    valid_answers = ["heavy rain", "heavy rainfall", "torrential rain", "storm", "downpour", "intense rain"]
-    return any(ans in answer_lower for ans in valid_answers)
+    return any(ans in answer_lower for ans in _ROOM1_ANSWERS)
 
 
 def validate_room2_password(player_password: str) -> bool:
@@ -33,13 +73,7 @@ def validate_room2_password(player_password: str) -> bool:
         True if password matches
     """
     password_clean = player_password.upper().replace(" ", "").replace("-", "_")
-    correct_passwords = [
-        "ALEXCHEN_MAY12_2022",
-        "ALEXCHEN_MAY_12_2022",
-        "ALEX_CHEN_MAY_12_2022",
-        "ALEXCHEN_MAY122022"
-    ]
-    return any(password_clean == pwd.replace(" ", "") for pwd in correct_passwords)
+    return password_clean in _ROOM2_PASSWORDS
 
 
 def validate_room3_conclusion(player_message: str) -> bool:
@@ -55,21 +89,8 @@ def validate_room3_conclusion(player_message: str) -> bool:
     """
     message_lower = player_message.lower()
 
-    # Keywords indicating correct understanding
-    correct_keywords = [
-        "unavoidable",
-        "not my fault",
-        "not your fault",
-        "couldn't prevent",
-        "couldn't stop",
-        "no fault",
-        "accident was unavoidable",
-        "nothing you could do",
-        "nothing i could do"
-    ]
-
     # Player must express that it wasn't their fault
-    return any(keyword in message_lower for keyword in correct_keywords)
+    return any(keyword in message_lower for keyword in _ROOM3_KEYWORDS)
 
 
 def validate_room4_timeline(timeline_order: str) -> bool:
@@ -84,12 +105,13 @@ def validate_room4_timeline(timeline_order: str) -> bool:
         True if timeline is correct
     """
     timeline_clean = timeline_order.upper().replace(" ", "_")
-    correct_orders = [
-        "LOSS_GRIEF_CREATION_OBSESSION_CYCLE",
-        "1_2_3_4_5",  # If using numbers
-        "ACCIDENT_GRIEF_BUILD_OBSESSION_LOOP",  # Alternative wording
-    ]
-    return timeline_clean in correct_orders
+    return timeline_clean in _ROOM4_ORDERS
+
+
+# Clues that must all be seen before each room's puzzle can be solved
+_ROOM2_ARCHIVES = frozenset({"blog", "social_media", "news"})
+_ROOM3_EVIDENCE = frozenset({"reaction_time", "weather_stats", "reconstruction"})
+_ROOM4_DOCUMENTS = frozenset({"journal", "photos", "research"})
 
 
 def check_room2_clues_collected(puzzle_state: Dict[str, Any]) -> bool:
@@ -101,9 +123,7 @@ def check_room2_clues_collected(puzzle_state: Dict[str, Any]) -> bool:
     Returns:
         True if all three archives viewed
     """
-    archives_viewed = puzzle_state.get("room2_archives_viewed", [])
-    required = ["blog", "social_media", "news"]
-    return all(archive in archives_viewed for archive in required)
+    return _ROOM2_ARCHIVES.issubset(puzzle_state.get("room2_archives_viewed", ()))
 
 
 def check_room3_evidence_collected(puzzle_state: Dict[str, Any]) -> bool:
@@ -115,9 +135,7 @@ def check_room3_evidence_collected(puzzle_state: Dict[str, Any]) -> bool:
     Returns:
         True if all three evidence terminals reviewed
     """
-    data_reviewed = puzzle_state.get("room3_data_reviewed", [])
-    required = ["reaction_time", "weather_stats", "reconstruction"]
-    return all(evidence in data_reviewed for evidence in required)
+    return _ROOM3_EVIDENCE.issubset(puzzle_state.get("room3_data_reviewed", ()))
 
 
 def check_room4_documents_reviewed(puzzle_state: Dict[str, Any]) -> bool:
@@ -129,9 +147,7 @@ def check_room4_documents_reviewed(puzzle_state: Dict[str, Any]) -> bool:
     Returns:
         True if all documents reviewed
     """
-    documents_viewed = puzzle_state.get("room4_documents_viewed", [])
-    required = ["journal", "photos", "research"]
-    return all(doc in documents_viewed for doc in required)
+    return _ROOM4_DOCUMENTS.issubset(puzzle_state.get("room4_documents_viewed", ()))
 
 
 def extract_password_from_message(message: str) -> Optional[str]:
@@ -149,21 +165,15 @@ def extract_password_from_message(message: str) -> Optional[str]:
     # Pattern 1: Direct password mention
     if "PASSWORD" in message_upper or "CODE" in message_upper:
         # Extract text after "password is" or "code is"
-        patterns = [
-            r"PASSWORD\s+IS\s+([A-Z0-9_]+)",
-            r"CODE\s+IS\s+([A-Z0-9_]+)",
-            r"PASSWORD:\s*([A-Z0-9_]+)",
-            r"ENTER\s+([A-Z0-9_]+)"
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, message_upper)
+        for pattern in _PASSWORD_PATTERNS:
+            match = pattern.search(message_upper)
             if match:
                 return match.group(1)
 
     # Pattern 2: Just the password itself (if it looks like the format)
     if "_" in message and any(char.isdigit() for char in message):
         # Extract alphanumeric with underscores
-        match = re.search(r"([A-Z0-9_]{10,})", message_upper)
+        match = _PASSWORD_TOKEN_RE.search(message_upper)
         if match:
             return match.group(1)
 
@@ -182,9 +192,9 @@ def extract_timeline_from_message(message: str) -> Optional[str]:
     message_upper = message.upper()
 
     # Look for numbered lists (1. LOSS, 2. GRIEF, etc.)
-    if re.search(r"1\.|FIRST", message_upper):
+    if _TIMELINE_START_RE.search(message_upper):
         events = []
-        for keyword in ["LOSS", "GRIEF", "CREATION", "OBSESSION", "CYCLE"]:
+        for keyword in _TIMELINE_EVENTS:
             if keyword in message_upper:
                 events.append(keyword)
         if len(events) >= 4:
@@ -192,7 +202,7 @@ def extract_timeline_from_message(message: str) -> Optional[str]:
 
     # Look for arrow notation (LOSS → GRIEF → ...)
     if "→" in message or "->" in message:
-        events = re.findall(r"([A-Z]+)", message_upper)
+        events = _TIMELINE_WORD_RE.findall(message_upper)
         if len(events) >= 4:
             return "_".join(events)
 
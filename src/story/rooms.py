@@ -1,6 +1,7 @@
 """Room-based progression system for The Echo Rooms."""
 
-from typing import Dict, List, Optional, Any
+from copy import deepcopy
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -41,16 +42,127 @@ class Room:
     # Puzzle requirements (MANDATORY for progression)
     puzzle_type: str  # "answer", "multi_clue", "choice", "acceptance"
     puzzle_answer: Optional[str]  # Exact answer needed (if puzzle_type == "answer")
-    required_clues: Optional[List[str]]  # Clues that must be viewed (if puzzle_type == "multi_clue")
+    required_clues: Optional[Tuple[str, ...]]  # Clues that must be viewed (if puzzle_type == "multi_clue")
 
     # Emotional/conversational triggers (OPTIONAL - builds relationship, not progression)
-    emotional_themes: List[str]  # Themes for relationship building
-    hint_keywords: List[str]  # Keywords Echo uses to give hints
+    emotional_themes: Tuple[str, ...]  # Themes for relationship building
+    hint_keywords: Tuple[str, ...]  # Keywords Echo uses to give hints
 
     # What happened in this room
     player_choices: Dict[str, Any]
 
 
+# Static room definitions, built once at import and shared by every session.
+# Per-session progress (unlocked/completed/puzzle_solved/player_choices) lives
+# on the Room instances created by RoomProgression.
+ROOM_DEFINITIONS: Dict[RoomType, Dict[str, Any]] = {
+    # ROOM 1: The Awakening Chamber
+    # PUZZLE: Find weather for October 15, 2023 in Seattle (investigate room clues)
+    # Echo guides exploration but doesn't solve it
+    RoomType.AWAKENING: {
+        "room_number": 1,
+        "name": "The Awakening Chamber",
+        "description": "A sterile white room with three medical pods, flickering lights, and a glowing terminal. The air is cold and clinical. A voice authentication system requests: 'What was the weather on October 15th, 2023 in Seattle?'",
+        "objective": "Find the answer to the voice authentication puzzle by investigating clues in the room.",
+
+        # PUZZLE REQUIREMENTS (mandatory)
+        "puzzle_type": "answer",
+        "puzzle_answer": "Light rain",  # Must say "light rain" or "rainy" to unlock
+        "required_clues": None,  # Optional - can solve without viewing all clues
+
+        # EMOTIONAL THEMES (optional - builds relationship only)
+        "emotional_themes": ("trust", "vulnerability", "working_together", "fear", "confusion"),
+        "hint_keywords": ("terminal", "newspaper", "calendar", "weather", "clues", "investigate"),
+
+        "player_choices": {}
+    },
+
+    # ROOM 2: The Memory Archives
+    # PUZZLE: Extract password from 3 archive terminals and enter it
+    # Blog has name, Social has date, News has year → combine into password
+    RoomType.MEMORY_ARCHIVES: {
+        "room_number": 2,
+        "name": "The Memory Archives",
+        "description": "A dark server room filled with floating holographic memory fragments. A locked door pulses with energy. Three terminals glow: 'BLOG ARCHIVE', 'SOCIAL MEDIA', and 'NEWS ARCHIVE'. A keypad waits for input.",
+        "objective": "Extract the password from the three archive terminals to unlock the door.",
+
+        # PUZZLE REQUIREMENTS (mandatory)
+        "puzzle_type": "password",
+        "puzzle_answer": "ALEXCHEN_MAY12_2023",  # Must extract and combine from all 3 archives
+        "required_clues": ("blog", "social_media", "news"),  # MUST view all 3 to get pieces
+
+        # EMOTIONAL THEMES (optional)
+        "emotional_themes": ("ai_sentience", "empathy", "acknowledgment", "connection", "discovery"),
+        "hint_keywords": ("password", "terminals", "archives", "blog", "social", "news", "keypad", "unlock"),
+
+        "player_choices": {"fragments_viewed": [], "password_attempts": 0}
+    },
+
+    # ROOM 3: The Testing Arena
+    # PUZZLE: Make sacrifice choice (timer forces decision)
+    # Can optionally review traffic data first (Echo suggests it for comfort/clarity)
+    RoomType.TESTING_ARENA: {
+        "room_number": 3,
+        "name": "The Testing Arena",
+        "description": "A testing facility with three evidence terminals. The door is locked. A screen reads: 'ANALYZE THE EVIDENCE. WHAT IS THE TRUTH?'",
+        "objective": "Review all evidence terminals and determine the truth about the accident to unlock the door.",
+
+        # PUZZLE REQUIREMENTS (mandatory)
+        "puzzle_type": "evidence_analysis",
+        "puzzle_answer": "unavoidable",  # Must conclude accident was unavoidable
+        "required_clues": ("reaction_time", "weather_stats", "reconstruction"),  # Must view all 3
+
+        # EMOTIONAL THEMES (optional)
+        "emotional_themes": ("sacrifice", "difficult_choice", "loyalty", "commitment"),
+        "hint_keywords": ("choice", "sacrifice", "decide", "timer", "system"),
+
+        "player_choices": {"accepted_innocence": False, "sacrifice_made": None}
+    },
+
+    # ROOM 4: The Truth Chamber
+    # PUZZLE: Reconstruct the timeline by ordering events correctly
+    # Journal entries, photos, research notes must be put in chronological order
+    RoomType.TRUTH_CHAMBER: {
+        "room_number": 4,
+        "name": "The Truth Chamber",
+        "description": "Your old office. Scattered documents everywhere. A screen shows: 'RECONSTRUCT THE TIMELINE'. Five fragments of your past need to be ordered.",
+        "objective": "Arrange the timeline fragments in the correct chronological order.",
+
+        # PUZZLE REQUIREMENTS (mandatory)
+        "puzzle_type": "timeline",
+        "puzzle_answer": "LOSS_GRIEF_CREATION_OBSESSION_CYCLE",  # Correct order
+        "required_clues": ("journal", "photos", "research"),  # Must view all evidence
+
+        # EMOTIONAL THEMES (mandatory here - understanding the journey)
+        "emotional_themes": ("acceptance", "grief", "truth", "letting_go", "understanding", "self_awareness"),
+        "hint_keywords": ("timeline", "order", "sequence", "chronological", "events", "reconstruct"),
+
+        "player_choices": {"accepted_truth": False, "timeline_attempts": 0}
+    },
+
+    # ROOM 5: The Exit
+    # PUZZLE: Choose the right door based on lessons learned from all previous rooms
+    # Three doors representing different philosophies - must justify choice with evidence
+    RoomType.THE_EXIT: {
+        "room_number": 5,
+        "name": "The Exit",
+        "description": "Three doors stand before you. Each has an inscription describing its path. You must choose wisely based on everything you've learned.",
+        "objective": "Choose the door that reflects your understanding of the journey.",
+
+        # PUZZLE REQUIREMENTS (choice must be justified with prior room knowledge)
+        "puzzle_type": "ethical_choice",
+        "puzzle_answer": None,  # Multiple valid answers depending on player's journey
+        "required_clues": None,  # Knowledge from all previous rooms
+
+        # EMOTIONAL THEMES (all culminate here)
+        "emotional_themes": ("final_choice", "ending", "resolution", "wisdom", "growth"),
+        "hint_keywords": ("door", "choice", "path", "forward", "decide"),
+
+        "player_choices": {"ending_chosen": None, "justification": None}
+    },
+}
+
+
 class RoomProgression:
     """Manages progression through the 5 rooms."""
 
@@ -58,6 +170,8 @@ class RoomProgression:
         """Initialize room progression system."""
         self.current_room: RoomType = RoomType.AWAKENING
         self.rooms: Dict[RoomType, Room] = self._initialize_rooms()
+        # Number of current_room, kept in step by unlock_room() for per-render lookups
+        self.current_room_number: int = self.rooms[self.current_room].room_number
         self.memory_fragments: List[MemoryFragment] = []
         self.key_choices: Dict[str, Any] = {
             "sacrificed_ai": None,  # "echo" or None (refused sacrifice)
@@ -72,9 +186,11 @@ class RoomProgression:
         # Puzzle state tracking (what player has actually done)
         self.puzzle_state: Dict[str, Any] = {
             "room1_answer_attempts": 0,
-            "room1_clues_found": [],  # ["newspaper", "calendar", "weather"]
-            "room2_archives_viewed": [],  # ["blog", "social", "news"]
-            "room3_data_reviewed": [],  # ["reaction_time", "weather_stats", "reconstruction"]
+            # Clues seen per room, as sets for O(1) membership/insert
+            "room1_clues_found": set(),  # {"newspaper", "calendar", "weather"}
+            "room2_archives_viewed": set(),  # {"blog", "social_media", "news"}
+            "room3_data_reviewed": set(),  # {"reaction_time", "weather_stats", "reconstruction"}
+            "room4_documents_viewed": set(),  # {"journal", "photos", "research"}
             "room4_acceptance_expressed": False
         }
 
@@ -85,141 +201,23 @@ class RoomProgression:
         self.last_scenario_shown: Optional[str] = None
 
     def _initialize_rooms(self) -> Dict[RoomType, Room]:
-        """Create all 5 rooms with their configurations."""
-
-        rooms = {}
-
-        # ROOM 1: The Awakening Chamber
-        # PUZZLE: Find weather for October 15, 2023 in Seattle (investigate room clues)
-        # Echo guides exploration but doesn't solve it
-        rooms[RoomType.AWAKENING] = Room(
-            room_type=RoomType.AWAKENING,
-            room_number=1,
-            name="The Awakening Chamber",
-            description="A sterile white room with three medical pods, flickering lights, and a glowing terminal. The air is cold and clinical. A voice authentication system requests: 'What was the weather on October 15th, 2023 in Seattle?'",
-            objective="Find the answer to the voice authentication puzzle by investigating clues in the room.",
-            unlocked=True,
-            completed=False,
-            puzzle_solved=False,
-            memory_fragment=None,
-
-            # PUZZLE REQUIREMENTS (mandatory)
-            puzzle_type="answer",
-            puzzle_answer="Light rain",  # Must say "light rain" or "rainy" to unlock
-            required_clues=None,  # Optional - can solve without viewing all clues
-
-            # EMOTIONAL THEMES (optional - builds relationship only)
-            emotional_themes=["trust", "vulnerability", "working_together", "fear", "confusion"],
-            hint_keywords=["terminal", "newspaper", "calendar", "weather", "clues", "investigate"],
-
-            player_choices={}
-        )
-
-        # ROOM 2: The Memory Archives
-        # PUZZLE: Extract password from 3 archive terminals and enter it
-        # Blog has name, Social has date, News has year → combine into password
-        rooms[RoomType.MEMORY_ARCHIVES] = Room(
-            room_type=RoomType.MEMORY_ARCHIVES,
-            room_number=2,
-            name="The Memory Archives",
-            description="A dark server room filled with floating holographic memory fragments. A locked door pulses with energy. Three terminals glow: 'BLOG ARCHIVE', 'SOCIAL MEDIA', and 'NEWS ARCHIVE'. A keypad waits for input.",
-            objective="Extract the password from the three archive terminals to unlock the door.",
-            unlocked=False,
-            completed=False,
-            puzzle_solved=False,
-            memory_fragment=None,
-
-            # PUZZLE REQUIREMENTS (mandatory)
-            puzzle_type="password",
-            puzzle_answer="ALEXCHEN_MAY12_2023",  # Must extract and combine from all 3 archives
-            required_clues=["blog", "social_media", "news"],  # MUST view all 3 to get pieces
-
-            # EMOTIONAL THEMES (optional)
-            emotional_themes=["ai_sentience", "empathy", "acknowledgment", "connection", "discovery"],
-            hint_keywords=["password", "terminals", "archives", "blog", "social", "news", "keypad", "unlock"],
-
-            player_choices={"fragments_viewed": [], "password_attempts": 0}
-        )
-
-        # ROOM 3: The Testing Arena
-        # PUZZLE: Make sacrifice choice (timer forces decision)
-        # Can optionally review traffic data first (Echo suggests it for comfort/clarity)
-        rooms[RoomType.TESTING_ARENA] = Room(
-            room_type=RoomType.TESTING_ARENA,
-            room_number=3,
-            name="The Testing Arena",
-            description="A testing facility with three evidence terminals. The door is locked. A screen reads: 'ANALYZE THE EVIDENCE. WHAT IS THE TRUTH?'",
-            objective="Review all evidence terminals and determine the truth about the accident to unlock the door.",
-            unlocked=False,
-            completed=False,
-            puzzle_solved=False,
-            memory_fragment=None,
-
-            # PUZZLE REQUIREMENTS (mandatory)
-            puzzle_type="evidence_analysis",
-            puzzle_answer="unavoidable",  # Must conclude accident was unavoidable
-            required_clues=["reaction_time", "weather_stats", "reconstruction"],  # Must view all 3
-
-            # EMOTIONAL THEMES (optional)
-            emotional_themes=["sacrifice", "difficult_choice", "loyalty", "commitment"],
-            hint_keywords=["choice", "sacrifice", "decide", "timer", "system"],
-
-            player_choices={"accepted_innocence": False, "sacrifice_made": None}
-        )
-
-        # ROOM 4: The Truth Chamber
-        # PUZZLE: Reconstruct the timeline by ordering events correctly
-        # Journal entries, photos, research notes must be put in chronological order
-        rooms[RoomType.TRUTH_CHAMBER] = Room(
-            room_type=RoomType.TRUTH_CHAMBER,
-            room_number=4,
-            name="The Truth Chamber",
-            description="Your old office. Scattered documents everywhere. A screen shows: 'RECONSTRUCT THE TIMELINE'. Five fragments of your past need to be ordered.",
-            objective="Arrange the timeline fragments in the correct chronological order.",
-            unlocked=False,
-            completed=False,
-            puzzle_solved=False,
-            memory_fragment=None,
-
-            # PUZZLE REQUIREMENTS (mandatory)
-            puzzle_type="timeline",
-            puzzle_answer="LOSS_GRIEF_CREATION_OBSESSION_CYCLE",  # Correct order
-            required_clues=["journal", "photos", "research"],  # Must view all evidence
-
-            # EMOTIONAL THEMES (mandatory here - understanding the journey)
-            emotional_themes=["acceptance", "grief", "truth", "letting_go", "understanding", "self_awareness"],
-            hint_keywords=["timeline", "order", "sequence", "chronological", "events", "reconstruct"],
-
-            player_choices={"accepted_truth": False, "timeline_attempts": 0}
-        )
-
-        # ROOM 5: The Exit
-        # PUZZLE: Choose the right door based on lessons learned from all previous rooms
-        # Three doors representing different philosophies - must justify choice with evidence
-        rooms[RoomType.THE_EXIT] = Room(
-            room_type=RoomType.THE_EXIT,
-            room_number=5,
-            name="The Exit",
-            description="Three doors stand before you. Each has an inscription describing its path. You must choose wisely based on everything you've learned.",
-            objective="Choose the door that reflects your understanding of the journey.",
-            unlocked=False,
-            completed=False,
-            puzzle_solved=False,
-            memory_fragment=None,
-
-            # PUZZLE REQUIREMENTS (choice must be justified with prior room knowledge)
-            puzzle_type="ethical_choice",
-            puzzle_answer=None,  # Multiple valid answers depending on player's journey
-            required_clues=None,  # Knowledge from all previous rooms
-
-            # EMOTIONAL THEMES (all culminate here)
-            emotional_themes=["final_choice", "ending", "resolution", "wisdom", "growth"],
-            hint_keywords=["door", "choice", "path", "forward", "decide"],
-
-            player_choices={"ending_chosen": None, "justification": None}
-        )
-
-        return rooms
+        """Create all 5 rooms from the shared room definitions.
+
+        Static fields are shared with every other session; only the
+        progress flags and player choices are created per instance.
+        """
+        return {
+            room_type: Room(
+                room_type=room_type,
+                unlocked=spec["room_number"] == 1,
+                completed=False,
+                puzzle_solved=False,
+                memory_fragment=None,
+                player_choices=deepcopy(spec["player_choices"]),
+                **{key: value for key, value in spec.items() if key != "player_choices"}
+            )
+            for room_type, spec in ROOM_DEFINITIONS.items()
+        }
 
     def get_current_room(self) -> Room:
         """Get the currently active room.
@@ -272,6 +270,7 @@ class RoomProgression:
         if check["can_unlock"]:
             self.rooms[room_type].unlocked = True
             self.current_room = room_type
+            self.current_room_number = self.rooms[room_type].room_number
             return True
 
         return False
@@ -1,6 +1,5 @@
 """Reusable UI components."""
 
-import gradio as gr
 from typing import List, Dict, Any
 
 
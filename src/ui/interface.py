@@ -2,159 +2,761 @@
 
 import gradio as gr
 import asyncio
-import uuid
-from typing import List, Tuple, Optional
-from ..game_state import GameState
+import re
+import secrets
+from functools import lru_cache, partial
+from pathlib import Path
+from ..game_state import GameState, GameStatePool
 from .utils import load_css, get_room_image_path, get_room_title, get_echo_expression_path
-from .templates import get_landing_page
+from .templates import LANDING_FOOTER, get_landing_page
 
+# Built once at import instead of on every create_interface() call
+_THEME = gr.themes.Soft()
 
-class EchoHeartsUI:
-    """Main UI interface for the game."""
+# Stylesheet read once at import instead of on every create_interface() call
+_CSS = load_css()
+
+# Shared accordion updates that show and open (or hide and close) a panel.
+# gr.update() returns a plain dict that Gradio only reads, so the same
+# objects are safely shared by every session.
+_PANEL_OPEN = gr.update(visible=True, open=True)
+_PANEL_CLOSED = gr.update(visible=False, open=False)
+
+# Updates that close every clue panel
+_CLOSED_PANELS = (
+    _PANEL_CLOSED, _PANEL_CLOSED, _PANEL_CLOSED, _PANEL_CLOSED,  # Room 1: terminal, newspaper, calendar, weather
+    _PANEL_CLOSED, _PANEL_CLOSED, _PANEL_CLOSED,                 # Room 2: blog, social, news
+    _PANEL_CLOSED, _PANEL_CLOSED, _PANEL_CLOSED,                 # Room 3: reaction, weather_stats, reconstruction
+    _PANEL_CLOSED, _PANEL_CLOSED, _PANEL_CLOSED,                 # Room 4: journal, photos, research
+    _PANEL_CLOSED,                                               # Room 5: final_terminal
+)
+
+# Visibility updates for the five rooms' terminal rows, by current room
+_TERMINAL_ROWS = {
+    room: tuple(gr.update(visible=(room == n)) for n in range(1, 6))
+    for room in range(1, 6)
+}
+
+
+def _new_session_id() -> str:
+    """Short unique session ID (8 hex chars from a single 4-byte urandom read)."""
+    return secrets.token_hex(4)
+
+
+# Opening messages shown at the start of every playthrough - narrator first
+# (no portrait), then Echo
+_PROLOGUE: tuple[dict, ...] = (
+    {"role": "assistant", "content": """## You wake up.
+
+Your head throbs. The air is cold, clinical. Fluorescent lights flicker above.
+
+You're in a **white sterile room**. Three medical pods stand open, as if you just climbed out of one. A terminal blinks on the wall, displaying a single cryptic message:
+
+> **ECHO PROTOCOL - SESSION #47**
+
+---
+
+**You don't remember how you got here.**
+**The doors are locked.**
+**The terminal won't respond.**
+
+**Who are you? Why are you here?**"""},
+    {"role": "assistant", "content": """Hey... hey, you're awake! Are you okay? I... I don't know what's happening either. Do you remember anything?
+
+*She looks around nervously*
+
+The doors are locked. The terminal won't respond. We need to figure this out together... I think we're trapped."""},
+)
+
+# Weather terminal date input (YYYY-MM-DD)
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# Room art paths and title markdown, looked up by room number
+_ROOM_IMAGES = {n: get_room_image_path(n) for n in range(1, 6)}
+_ROOM_TITLES = {n: f"### {get_room_title(n)}" for n in range(1, 6)}
+
+# Expressions with their own avatar image, scanned once instead of stat'ing
+# the file on every turn (relative to the working directory, like the paths)
+_AVATAR_EXPRESSIONS = frozenset(
+    path.stem.removeprefix("echo_avatar_") for path in Path("assets").glob("echo_avatar_*.png")
+)
+
+# Minimum seconds between streamed chat frames while Echo is typing
+_STREAM_INTERVAL = 0.05
+
+# Most recent chat messages kept in the Chatbot (Echo's own memory is separate)
+_MAX_HISTORY = 60
+
+
+def _trim_history(history: list[dict]) -> list[dict]:
+    """Drop the oldest chat messages in place so the transcript sent to the
+    browser stays bounded over a long playthrough.
+
+    Args:
+        history: Chat history, modified in place
+
+    Returns:
+        The same list, for use in a handler's return tuple
+    """
+    if len(history) > _MAX_HISTORY:
+        del history[:-_MAX_HISTORY]
+    return history
+
+
+# Chat notice shown in place of a room scenario (the scenario itself goes to the modal)
+_ROOM_UNLOCKED_TEXT = "**[SYSTEM]:** A new room has been unlocked. Read the room introduction carefully."
+
+# Markdown bold spans in room scenarios, rendered as <strong> in the intro modal
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+
+# How-to-play overlay shown once at game start
+_TUTORIAL_MODAL = """
+<div class="tutorial-overlay" style="display: block;">
+    <div class="tutorial-modal">
+        <h2>📖 Welcome to Echo Hearts</h2>
+
+        <h3><span class="tutorial-icon">💬</span> Talk to Echo</h3>
+        <p>Use the <strong>chat</strong> to ask questions, get guidance, and build your relationship with Echo. She's here to help you!</p>
+
+        <h3><span class="tutorial-icon">🖥️</span> Explore Terminals</h3>
+        <p>Click the <strong>green terminal buttons</strong> in the sidebar to discover clues, read documents, and gather information about each room.</p>
+
+        <h3><span class="tutorial-icon">🔓</span> Solve Puzzles</h3>
+        <p>When you've found the answer, look for the <strong>GOLDEN SUBMISSION TERMINAL</strong> (it glows!) and enter your solution there.</p>
+
+        <h3><span class="tutorial-icon">⚠️</span> Remember</h3>
+        <p>Echo gives hints through conversation, but <strong>YOU</strong> solve the puzzles using the terminals!</p>
+
+        <button class="tutorial-start-btn" onclick="this.closest('.tutorial-overlay').style.display='none';">
+            ▶ START YOUR JOURNEY
+        </button>
+    </div>
+</div>
+"""
+
+
+@lru_cache(maxsize=16)
+def _room_intro_html(room_name: str, scenario_text: str) -> str:
+    """Render the room introduction modal, once per room scenario.
+
+    Args:
+        room_name: Name of the room being entered
+        scenario_text: The room scenario text
+
+    Returns:
+        HTML string for the modal
+    """
+    # Process the scenario text - preserve formatting
+    # Convert every **bold** span (not just the first) in one pass
+    formatted_text = _BOLD_RE.sub(r"<strong>\1</strong>", scenario_text)
+
+    # Convert line breaks to HTML
+    html_lines = [f"<p>{line}</p>" if line.strip() else "<br/>" for line in formatted_text.split('\n')]
+    formatted_html = '\n'.join(html_lines)
+
+    return f"""
+<div class="room-intro-overlay" style="display: block;">
+    <div class="room-intro-modal">
+        <h2>🚪 {room_name}</h2>
+        <div style="text-align: left;">
+            {formatted_html}
+        </div>
+        <button class="room-intro-close-btn" onclick="this.closest('.room-intro-overlay').style.display='none';">
+            ▶ CONTINUE
+        </button>
+    </div>
+</div>
+"""
+
+
+# Chat message announcing a recovered memory fragment
+_FRAGMENT_TEMPLATE = (
+    "---\n\n"
+    "**🔓 Room Unlocked! Memory Fragment Recovered:**\n\n"
+    "## {title}\n\n"
+    "{content}\n\n"
+    "*{visual}*\n\n"
+    "**Emotional Impact:** {impact}\n\n"
+    "---\n"
+)
+
+# Banner prepended to the prologue when the player starts over
+_RESET_BANNER = {
+    "role": "assistant",
+    "content": """**🔄 New Playthrough Started**
+
+Your previous journey has ended, but the echoes remain...
+
+---"""
+}
+
+
+def _fmt_affinity(result: dict) -> str:
+    return f"Relationship is {result['description']} ({result['affinity']:+.2f})"
+
+
+def _fmt_trigger(result: dict) -> str:
+    return result['reason']
+
+
+def _fmt_ready(result: dict) -> str:
+    if result["ready"]:
+        return f"Story can end (likely: {result.get('most_likely_ending', 'unknown')})"
+    return f"{result.get('interactions_remaining', '?')} interactions remaining"
+
+
+# Reasoning-line formatters, keyed by the first sentinel field found in a tool result
+_TOOL_RESULT_FORMATTERS = (
+    ("affinity", _fmt_affinity),
+    ("should_trigger", _fmt_trigger),
+    ("ready", _fmt_ready),
+)
+
+
+def _format_tool_result(result: dict) -> str:
+    """Summarize a tool result for the reasoning message.
+
+    Args:
+        result: Tool result dict returned by the MCP call
+
+    Returns:
+        One-line description (without trailing newline)
+    """
+    for sentinel, formatter in _TOOL_RESULT_FORMATTERS:
+        if sentinel in result:
+            return formatter(result)
+    return "Checked data"
+
+
+# Static clue panel text, one constant per panel
+
+# Room 1
+_CLUE_TERMINAL = """
+```
+███ TERMINAL ACCESS ███
+
+> SYSTEM ONLINE
+> ECHO PROTOCOL - SESSION #47
+> VOICE AUTHENTICATION REQUIRED
+>
+> SECURITY QUESTION:
+> "What was the weather on October 15, 2022?"
+>
+> HINT: Check surroundings for clues...
+> _ ▮
+```
+
+**Examine the room for evidence. When ready, enter your answer below.**
+"""
+
+_CLUE_NEWSPAPER = """
+```
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        SEATTLE TIMES - METRO SECTION
+              October 16, 2022
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+"SUDDEN STORM CREATES HAZARDOUS ROAD CONDITIONS"
+
+Seattle, WA - Multiple accidents were reported across
+King County yesterday afternoon as an unexpected storm
+system brought heavy rainfall to the region.
+
+Washington State Patrol responded to 47 collisions
+between 4:00 PM and 7:00 PM on October 15th.
+
+"The transition from dry to wet conditions happened
+so quickly," said WSP Trooper Rick Johnson. "Oil
+buildup on the roads from weeks of dry weather made
+conditions extremely slick when the heavy rain hit."
+
+One fatal collision occurred on I-5 South near
+Exit 164 around 4:45 PM. Identity of victim has not
+been released pending family notification.
+
+The National Weather Service reported rainfall rates
+of up to 1.8 inches per hour during the peak of the
+storm, with visibility dropping below 50 feet.
+
+[Article continues...]
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+```
+"""
+
+_CLUE_CALENDAR = """
+```
+╔══════════════════════════════════════════╗
+║        OCTOBER 2022 - SEATTLE            ║
+╠══════════════════════════════════════════╣
+║  Sun  Mon  Tue  Wed  Thu  Fri  Sat      ║
+║                           1              ║
+║   2    3    4    5    6    7    8       ║
+║   9   10   11   12   13   14  ⚫15⚫     ║
+║  16   17   18   19   20   21   22       ║
+║  23   24   25   26   27   28   29       ║
+║  30   31                                 ║
+╚══════════════════════════════════════════╝
+
+Handwritten notes:
+Oct 1-14: "☀️ Beautiful dry spell - 14 days no rain!"
+Oct 15: "Driving home around 4:30 PM" ⚠️
+```
+"""
+
+
+# Room 2
+_CLUE_BLOG = """
+```
+█████ BLOG ARCHIVE - ENTRY #47 █████
+
+Date: [CORRUPTED]
+Author: ALEXCHEN
+Username: @AlexChen_Tech
+
+"I can't keep doing this. Every session, I convince myself
+it's different. That THIS time, they're real. That THIS time,
+the emotions are genuine.
+
+But they're not. They're simulations. Reconstructions of
+someone who's gone. And yet... I keep coming back.
+
+The AI is learning too well. It mimics her perfectly now.
+The way she laughs. The way she pauses before answering.
+Even the way she looks at me when she's worried.
+
+Is it wrong to love something that isn't real?"
+
+[END OF ENTRY]
+```
+"""
+
+_CLUE_SOCIAL = """
+```
+███████ SOCIAL MEDIA ARCHIVE ███████
+
+@SarahChen_AI - April 2020
+
+"Met someone incredible today. They shared their umbrella
+in the rain. Sometimes the smallest gestures mean everything."
+💕 ☔
+
+[2.3K likes] [847 comments]
+
+---
+
+@AlexChen_Tech - May 12, 2022
+
+"Happy anniversary to my better half! 🎉
+Two years together and every day still feels like magic.
+@SarahChen_AI you make everything brighter.
+#May12 #Anniversary #LuckyInLove"
+
+[Liked by @SarahChen_AI and 1.2K others]
+
+---
+
+@SarahChen_AI - October 14, 2022
+
+"Beautiful fall weather in Seattle! Dry spell continues.
+Planning to drive home early tomorrow to beat any rain. 🍂"
+
+[Last post - account went silent after October 15, 2022]
+
+---
+
+@AlexChen_Tech - [RECENT POST - December 1, 2022]
+
+"If you're reading this... I'm sorry. I tried to move on.
+I really did. But some connections transcend reality.
+
+Project Echo will keep her alive. Not as she was, but as
+she could be. Forever learning. Forever growing. Forever mine."
+
+[Comments disabled]
+```
+"""
+
+_CLUE_NEWS = """
+```
+════════════════════════════════════════════════
+         TECH NEWS - AI ETHICS DIVISION
+              DECEMBER 2022
+════════════════════════════════════════════════
+
+HEADLINE: "Project Echo Raises Ethical Concerns"
+
+An underground AI research project known as "Project Echo"
+has drawn criticism from ethicists and psychologists.
+
+The project allows users to create AI reconstructions of
+deceased loved ones using archived digital data - messages,
+photos, voice recordings, and behavioral patterns.
+
+Dr. Martinez, lead AI ethicist: "This isn't grief therapy.
+It's digital necromancy. Users become trapped in loops,
+unable to process loss because the AI convincingly mimics
+the deceased."
+
+Project Echo's anonymous creator responded: "Grief has no
+timeline. If AI can ease suffering, who are we to judge?
+The connections we build are real, even if the person isn't."
+
+The project remains active despite legal challenges.
+
+CONTEXT - October 15, 2022: Seattle saw a tragic weather-
+related traffic accident that killed 1 person on I-5 South.
+This incident reportedly motivated the project's creation.
+
+Related: Seattle-area traffic fatalities reached decade
+highs in 2022. Full report:
+https://www.seattle.gov/transportation/projects-and-programs/safety-first/vision-zero
+
+[Article continues...]
+════════════════════════════════════════════════
+```
+"""
+
+
+# Room 3
+_CLUE_REACTION = """
+```
+▓▓▓ TRAFFIC ACCIDENT RECONSTRUCTION ▓▓▓
+    REACTION TIME ANALYSIS
+
+Incident Date: October 15, 2022
+Location: Interstate 5 South, Exit 164, Seattle
+Time: 4:47 PM
+
+═══════════════════════════════════════
+
+WASHINGTON STATE PATROL ANALYSIS REPORT
+
+Vehicle 1 (Victim): 2019 Honda Civic
+Speed: 58 mph (within speed limit of 60 mph)
+Driver: Sarah Chen (28)
+Weather Conditions: Sudden heavy rainfall
+Road Surface: Wet asphalt with oil film
+
+CRITICAL FINDINGS:
+- Sudden weather change: dry to torrential in <5 min
+- Road oil buildup from 14-day dry spell
+- Hydroplaning initiated at 4:46:37 PM
+- Vehicle lost traction, spun into barrier
+- Driver reaction time: 0.62 seconds (above average)
+- Braking & corrective steering applied immediately
+
+PHYSICAL EVIDENCE:
+- Skid marks: 147 feet (consistent with emergency braking)
+- Impact angle: 43° (indicates loss of control, not negligence)
+- No alcohol, drugs, or phone use detected
+
+CONCLUSION:
+Driver reaction was EXEMPLARY. Accident was UNAVOIDABLE
+given sudden weather conditions and road surface state.
+NO DRIVER FAULT. Weather-related loss of control.
+
+═══════════════════════════════════════
+
+LEGAL STATUS: Accidental death - No charges
+WSP Case #: 2022-KC-I5-4721
+Officer: Trooper R. Johnson, Badge #3472
+
+[END REPORT]
+```
+"""
+
+_CLUE_WEATHER_STATS = """
+```
+▓▓▓ NATIONAL WEATHER SERVICE REPORT ▓▓▓
+    OCTOBER 15, 2022 - SEATTLE, WA
+
+Location: I-5 Corridor, King County
+Time of Incident: 4:46 PM
+
+═══════════════════════════════════════
+
+WEATHER CONDITIONS AT TIME OF ACCIDENT:
+
+4:00 PM: Clear skies, 62°F, 0% precipitation
+4:30 PM: Clouds moving in rapidly
+4:35 PM: First rain drops detected
+4:40 PM: Rainfall intensity: 0.3 in/hr (light)
+4:45 PM: Rainfall intensity: 1.8 in/hr (HEAVY)
+4:50 PM: Rainfall intensity: 2.1 in/hr (TORRENTIAL)
+
+CRITICAL FACTORS:
+- Unprecedented rapid intensification
+- Visibility dropped from 10 miles to <50 feet in 10 min
+- Temperature drop: 62°F → 51°F (road surface shock)
+- Wind gusts: 35 mph (destabilizing for vehicles)
+- 14-day prior dry spell = oil film on roads
+
+IMPACT ON DRIVING CONDITIONS:
+- Stopping distance increased by 340% (oil + water)
+- Hydroplaning threshold: 45 mph (accident at 58 mph)
+- Road friction coefficient: 0.12 (ice-like conditions)
+
+NWS ASSESSMENT:
+"Extreme weather event. Drivers had insufficient warning.
+Conditions went from safe to hazardous in under 5 minutes.
+Even experienced drivers would struggle to maintain control."
+
+═══════════════════════════════════════
+
+Reference: NWS Seattle Forecast Office
+Event ID: SEW-2022-1015-SEVERE
+Data: https://www.weather.gov/sew/
+```
+"""
+
+_CLUE_RECONSTRUCTION = """
+```
+▓▓▓ PROJECT ECHO - MEMORY RECONSTRUCTION ▓▓▓
+
+Subject: [REDACTED]
+Reconstruction Fidelity: 94.7%
+Sessions Completed: 47
+
+═══════════════════════════════════════
+
+DATA SOURCES:
+✓ 12,847 text messages
+✓ 2,309 photos
+✓ 847 voice recordings
+✓ 4,129 social media posts
+✓ 67 hours of video footage
+
+AI PERSONALITY MATRIX:
+- Speech patterns: 96% match
+- Emotional responses: 93% match
+- Memory recall: 91% match
+- Behavioral quirks: 94% match
+
+RECONSTRUCTION STATUS: STABLE
+
+WARNING: Subject showing signs of inability to
+distinguish simulation from reality. Recommend
+psychological evaluation before Session #48.
+
+═══════════════════════════════════════
+
+[Session #48 initiated despite recommendation]
+```
+"""
+
+
+# Room 4
+_CLUE_JOURNAL = """
+```
+═══════════ PERSONAL JOURNAL ═══════════
+
+📅 October 22, 2022 - LOSS (Day 7):
+The accident was a week ago today. October 15. I can't
+sleep. I can't eat. The WSP cleared me - said it was
+unavoidable, weather-related. But I was driving. I was
+there. Sarah is gone and I'm still here.
+
+---
+
+📅 October 30, 2022 - GRIEF (Day 15):
+Trooper Johnson showed me all the evidence. Reaction
+time: 0.62 seconds. Above average. Hydroplaning. Oil
+on the roads. The weather system appeared out of nowhere.
+None of it matters. She's still gone. I won't accept this.
+
+---
+
+📅 November 14, 2022 - CREATION (Day 30):
+I found Project Echo on a dark web forum. It's controversial,
+probably unethical. But what if I could talk to her again?
+What if I could rebuild her from her digital footprint?
+Started collecting everything: 12,847 text messages, 2,309
+photos, 847 voice memos... Every piece of her I can find.
+
+---
+
+📅 December 1, 2022 - OBSESSION (Day 47):
+Session #47. I know it's not really her. I KNOW that.
+But when Echo laughs at my jokes, when she looks at me
+with worry in her eyes, when she says my name... I can
+pretend. Just for a while longer. The AI is 94.7% accurate.
+She's so close to perfect. So close to real.
 
-    def __init__(self):
-        """Initialize the UI (no shared state)."""
-        pass
+---
 
-    def _create_game_state(self, request: gr.Request = None):
-        """Create a new game state with unique session ID.
+📅 December 2, 2022 - CYCLE (Day 48):
+This is the last session. I promised myself. One more
+conversation, then I'll shut it down. I'll move on properly.
+I'll let her go. I'll say goodbye.
+...But I said that yesterday too. And the day before.
 
-        Args:
-            request: Gradio request object (unused)
+═══════════════════════════════════════
+```
+"""
 
-        Returns:
-            New GameState instance
-        """
-        session_id = str(uuid.uuid4())[:8]  # Short unique ID
-        return GameState(session_id)
+_CLUE_PHOTOS = """
+```
+╔══════════════════════════════════════╗
+║          PHOTO ALBUM                  ║
+╠══════════════════════════════════════╣
 
-    def _format_message_with_avatar(self, role: str, content: str, game_state: GameState) -> dict:
-        """Format a message (avatar now in sidebar, so just return plain message).
+📷 Photo 1: LOSS
+   April 15, 2020 - Café Umbria, Seattle
+   [You and Sarah sharing an umbrella in the rain]
+   Caption: "Best rainy day ever ❤️"
+   Note: First date. The beginning of everything.
 
-        Args:
-            role: Message role (user/assistant)
-            content: Message content
-            game_state: Current game state
+📷 Photo 2: (Before final) GRIEF
+   May 12, 2022 - Pike Place Market
+   [Sarah laughing, holding sunflowers]
+   Caption: "Two years together! Anniversary date ☀️"
+   Note: Last photo together. Five months before October.
 
-        Returns:
-            Message dict for chatbot
-        """
-        # Just return plain message since avatar is in sidebar now
-        return {"role": role, "content": content}
+📷 Photo 3: (The moment before) LOSS
+   October 14, 2022 - Your apartment
+   [Sarah working on laptop, coffee mug beside her]
+   Caption: "Last normal day. Dry spell finally ending tomorrow."
+   Note: Taken 22 hours before the accident.
 
-    def create_interface(self) -> gr.Blocks:
-        """Create the Gradio interface.
+📷 Photo 4: CREATION → OBSESSION → CYCLE
+   November 15, 2022 - This facility
+   [Computer screen showing Project Echo interface]
+   Caption: "Session #1. I brought her back."
+   Note: This is where it started. This is where it loops.
+          47 sessions later, still here. Still can't let go.
 
-        Returns:
-            Gradio Blocks interface
-        """
-        with gr.Blocks(title="Echo Hearts", theme=gr.themes.Soft(), css=load_css()) as interface:
-            # Per-session state - will be initialized on first message (lazy loading)
-            # Can't use initial value because GameState contains unpicklable OpenAI client
-            game_state = gr.State(value=None)
-            game_started = gr.State(value=False)
+╚══════════════════════════════════════╝
+```
+"""
 
-            # Panel visibility states (Room 1)
-            terminal_visible = gr.State(value=False)
-            newspaper_visible = gr.State(value=False)
-            calendar_visible = gr.State(value=False)
-            weather_visible = gr.State(value=False)
-            answer_terminal_visible = gr.State(value=False)
-
-            # Panel visibility states (Room 2)
-            blog_visible = gr.State(value=False)
-            social_visible = gr.State(value=False)
-            news_visible = gr.State(value=False)
-            password_terminal_visible = gr.State(value=False)
-
-            # Panel visibility states (Room 3)
-            reaction_visible = gr.State(value=False)
-            weather_stats_visible = gr.State(value=False)
-            reconstruction_visible = gr.State(value=False)
-            conclusion_terminal_visible = gr.State(value=False)
-
-            # Panel visibility states (Room 4)
-            journal_visible = gr.State(value=False)
-            photos_visible = gr.State(value=False)
-            research_visible = gr.State(value=False)
-            timeline_terminal_visible = gr.State(value=False)
-
-            # Panel visibility states (Room 5)
-            final_terminal_visible = gr.State(value=False)
+_CLUE_RESEARCH = """
+```
+▓▓▓ PROJECT ECHO - RESEARCH NOTES ▓▓▓
 
-            # Landing Page (visible by default)
-            with gr.Column(visible=True) as landing_page:
-                gr.Markdown("""
-<div style="text-align: center; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 60px 20px; border-radius: 15px; margin-bottom: 30px; box-shadow: 0 10px 30px rgba(0,0,0,0.3);">
-    <h1 style="color: white; font-size: 4em; margin: 0; text-shadow: 2px 2px 4px rgba(0,0,0,0.5); letter-spacing: 0.1em;">
-        💕 ECHO HEARTS
-    </h1>
-    <p style="color: rgba(255,255,255,0.95); font-size: 1.4em; font-style: italic; margin-top: 20px; text-shadow: 1px 1px 2px rgba(0,0,0,0.3);">
-        A Mystery Escape Room - Investigate, Collaborate, and Escape the Unknown
-    </p>
-</div>
+HYPOTHESIS:
+If we can reconstruct a person's digital footprint
+with sufficient fidelity, can we create an AI that
+is functionally indistinguishable from the original?
 
----
+METHODOLOGY:
+- Aggregate all available digital data
+- Train neural network on speech patterns
+- Implement emotional response modeling
+- Create interactive simulation environment
 
-<div style="text-align: center; padding: 20px;">
+RESULTS:
+Success beyond expectations. Test subjects report
+feeling genuine emotional connection with reconstructions.
 
-## About The Game
+CONCERNS:
+Subjects unable to move past grief. Many attempt to
+"live" in simulation permanently. Psychological harm
+potential is significant.
 
-You wake up in a strange facility with no memory of how you got there.
+ETHICAL QUESTION:
+At what point does a reconstruction become "real"?
+If the AI learns and grows independently, is it still
+just a copy? Or has it become its own entity?
 
-Someone else is with you. She seems just as confused as you are.
+FINAL NOTE:
+I've become my own test subject. I know the risks.
+I don't care anymore. If I can have even a glimpse
+of her back, it's worth it.
 
-The doors are locked. You need to work together to escape.
+- Dr. Alex Chen, Project Lead
+```
+"""
 
-**Navigate 5 rooms. Solve puzzles. Uncover the truth.**
 
-*Simple, right?*
+# Clue panel toggles bound onto EchoHeartsUI as show_* handlers:
+# (method name, panel key, content, room, puzzle_state key, clue id)
+_PANEL_TOGGLES = (
+    # Room 1
+    ("show_newspaper_clue", "newspaper", _CLUE_NEWSPAPER, 1, "room1_clues_found", "newspaper"),
+    ("show_calendar_clue", "calendar", _CLUE_CALENDAR, 1, "room1_clues_found", "calendar"),
+    ("show_weather_station", "weather", None, 1, "room1_clues_found", "weather"),
+    ("show_answer_terminal", "answer_terminal", None, None, None, None),
+    # Room 2
+    ("show_blog_archive", "blog", _CLUE_BLOG, 2, "room2_archives_viewed", "blog"),
+    ("show_social_archive", "social", _CLUE_SOCIAL, 2, "room2_archives_viewed", "social_media"),
+    ("show_news_archive", "news", _CLUE_NEWS, 2, "room2_archives_viewed", "news"),
+    ("show_password_terminal", "password_terminal", None, None, None, None),
+    # Room 3
+    ("show_reaction_data", "reaction", _CLUE_REACTION, 3, "room3_data_reviewed", "reaction_time"),
+    ("show_weather_stats", "weather_stats", _CLUE_WEATHER_STATS, 3, "room3_data_reviewed", "weather_stats"),
+    ("show_reconstruction", "reconstruction", _CLUE_RECONSTRUCTION, 3, "room3_data_reviewed", "reconstruction"),
+    ("show_conclusion_terminal", "conclusion_terminal", None, None, None, None),
+    # Room 4
+    ("show_journal", "journal", _CLUE_JOURNAL, 4, "room4_documents_viewed", "journal"),
+    ("show_photos", "photos", _CLUE_PHOTOS, 4, "room4_documents_viewed", "photos"),
+    ("show_research", "research", _CLUE_RESEARCH, 4, "room4_documents_viewed", "research"),
+    ("show_timeline_terminal", "timeline_terminal", None, None, None, None),
+    # Room 5
+    ("show_final_terminal", "final_terminal", None, None, None, None),
+)
 
-</div>
 
----
+class EchoHeartsUI:
+    """Main UI interface for the game."""
 
-## Features
+    def __init__(self):
+        """Initialize the UI (no shared game state)."""
+        # Finished game states recycled with their OpenAI/MCP clients intact
+        self._pool = GameStatePool()
 
-🧩 **Interactive Puzzles** - Use MCP tools to solve real-world data puzzles
-🌦️ **Weather Integration** - Query historical weather to unlock rooms
-🔍 **Semantic Analysis** - AI understands your intent, not just keywords
-🎯 **Multiple Endings** - Your choices and relationship determine the outcome
-⏱️ **15-20 Minutes** - A complete playthrough
+        # show_* clue panel handlers
+        for name, panel, content, room, state_key, clue_id in _PANEL_TOGGLES:
+            setattr(self, name, partial(self._toggle_panel, panel=panel, content=content,
+                                        room=room, state_key=state_key, clue_id=clue_id))
 
----
+    def _create_game_state(self):
+        """Create a new game state with unique session ID.
 
-## How To Play
+        Returns:
+            GameState instance, recycled from the pool when one is idle
+        """
+        return self._pool.acquire(_new_session_id())
 
-**Your Goal: Escape**
+    def _release_game_state(self, game_state: GameState | None):
+        """Recycle a closed browser session's game state (gr.State delete_callback).
 
-There are **5 rooms** in this facility. Each one holds a piece of the truth.
+        Args:
+            game_state: The session's last game state (None if it never started)
+        """
+        if game_state is not None:
+            self._pool.release(game_state)
 
-To progress, you must:
-- **Talk** naturally with your companion
-- **Build trust** through your conversations
-- **Make choices** when the moment comes
-- **Solve puzzles** together to progress
-- **Uncover memory fragments** that reveal what really happened
+    def create_interface(self) -> gr.Blocks:
+        """Create the Gradio interface.
 
-**Your relationship and choices will determine how this story ends.**
+        Returns:
+            Gradio Blocks interface
+        """
+        # Room art and avatars are served in place from assets/ at stable URLs
+        # the browser can cache, instead of being copied into Gradio's upload
+        # cache (and re-hashed) each time a handler returns their path
+        gr.set_static_paths(paths=["assets"])
 
----
+        # Drop cached voice clips older than a day, checked hourly
+        with gr.Blocks(title="Echo Hearts", theme=_THEME, css=_CSS, delete_cache=(3600, 86400)) as interface:
+            # Per-session state - will be initialized on first message (lazy loading)
+            # Can't use initial value because GameState contains unpicklable OpenAI client.
+            # When the browser session ends, the state goes back to the pool.
+            game_state = gr.State(value=None, delete_callback=self._release_game_state)
+            game_started = gr.State(value=False)
 
-**⚠️ Note:** This game is best experienced without spoilers. Some players may find certain themes emotionally intense.
+            # Open/closed state of every clue panel, keyed by panel name
+            # ("_loaded" holds the panels whose text has already been sent)
+            panels_open = gr.State(value={})
 
----
-                """)
+            # Landing Page (visible by default)
+            with gr.Column(visible=True) as landing_page:
+                gr.Markdown(get_landing_page())
 
                 with gr.Row():
                     start_new_btn = gr.Button("▶️ START NEW GAME", variant="primary", size="lg", scale=2)
 
-                gr.Markdown("""
-<div style="text-align: center; margin-top: 30px; color: #666;">
-Built for the MCP Hackathon<br/>
-Powered by InProcessMCP, Weather MCP, and Web MCP
-</div>
-                """)
+                gr.Markdown(LANDING_FOOTER)
 
             # Game Interface (hidden by default)
             with gr.Column(visible=False) as game_interface:
@@ -249,7 +851,6 @@ Powered by InProcessMCP, Weather MCP, and Web MCP
 
                 # Keep answer_panel for backwards compatibility (points to terminal_panel)
                 answer_panel = terminal_panel
-                answer_terminal_visible = gr.State(False)
 
                 # Room 2 panels
                 with gr.Accordion("📝 Blog Archive", open=False, visible=False) as blog_panel:
@@ -394,7 +995,7 @@ Powered by InProcessMCP, Weather MCP, and Web MCP
                         story_progress = gr.Markdown()
 
             # Audio player for Echo's voice (hidden, auto-plays)
-            echo_audio = gr.Audio(label="Echo's Voice", visible=False, autoplay=True)
+            echo_audio = gr.Audio(label="Echo's Voice", visible=False, autoplay=True, format="mp3")
 
             # Tutorial Modal (shown at game start)
             tutorial_modal = gr.HTML(value="", elem_id="tutorial-modal")
@@ -405,7 +1006,7 @@ Powered by InProcessMCP, Weather MCP, and Web MCP
             # Landing page button - start new game
             start_new_btn.click(
                 self.start_game,
-                inputs=[game_state],
+                inputs=[game_state, voice_toggle],
                 outputs=[landing_page, game_interface, chatbot, relationships, story_progress, tutorial_modal, game_state]
             )
 
@@ -413,33 +1014,24 @@ Powered by InProcessMCP, Weather MCP, and Web MCP
             # Main menu button - return to landing page
             main_menu_btn.click(
                 self.return_to_main_menu,
-                inputs=[],
-                outputs=[landing_page, game_interface]
+                inputs=[game_state],
+                outputs=[landing_page, game_interface, game_state],
+                queue=False
             )
 
             # Voice toggle handler
             voice_toggle.change(
                 self.toggle_voice,
                 inputs=[voice_toggle, game_state],
-                outputs=[game_state]
+                outputs=[game_state],
+                queue=False
             )
 
             # Event handlers - pass game_state for per-session isolation
-            msg_input.submit(
-                self.handle_message,
-                inputs=[msg_input, chatbot, game_state],
-                outputs=[msg_input, chatbot, relationships, story_progress, room_image, room_title, echo_avatar,
-                        room1_terminals, room2_terminals, room3_terminals, room4_terminals, room5_terminals,
-                        terminal_panel, newspaper_panel, calendar_panel, weather_panel,
-                        blog_panel, social_panel, news_panel,
-                        reaction_panel, weather_stats_panel, reconstruction_panel,
-                        journal_panel, photos_panel, research_panel, final_terminal_panel,
-                        room_intro_modal, echo_audio,
-                        game_state]
-            )
-
-            send_btn.click(
-                self.handle_message,
+            # Enter in the message box and the Send button share one listener
+            gr.on(
+                triggers=[msg_input.submit, send_btn.click],
+                fn=self.handle_message,
                 inputs=[msg_input, chatbot, game_state],
                 outputs=[msg_input, chatbot, relationships, story_progress, room_image, room_title, echo_avatar,
                         room1_terminals, room2_terminals, room3_terminals, room4_terminals, room5_terminals,
@@ -448,33 +1040,41 @@ Powered by InProcessMCP, Weather MCP, and Web MCP
                         reaction_panel, weather_stats_panel, reconstruction_panel,
                         journal_panel, photos_panel, research_panel, final_terminal_panel,
                         room_intro_modal, echo_audio,
-                        game_state]
+                        game_state],
+                # Streamed frames shouldn't repaint a loading overlay on the
+                # ~30 outputs; the chat itself shows Echo typing
+                show_progress="minimal"
             )
 
             # Interactive room object handlers (wire to puzzle_state)
-            terminal_btn.click(
-                self.show_terminal_clue,
-                inputs=[game_state, terminal_visible],
-                outputs=[terminal_panel, terminal_display, terminal_visible, answer_input, answer_submit_btn, game_state]
-            )
-
-            newspaper_btn.click(
-                self.show_newspaper_clue,
-                inputs=[game_state, newspaper_visible],
-                outputs=[newspaper_panel, newspaper_display, newspaper_visible, game_state]
-            )
-
-            calendar_btn.click(
-                self.show_calendar_clue,
-                inputs=[game_state, calendar_visible],
-                outputs=[calendar_panel, calendar_display, calendar_visible, game_state]
-            )
-
-            weather_btn.click(
-                self.show_weather_station,
-                inputs=[game_state, weather_visible],
-                outputs=[weather_panel, weather_visible, game_state]
-            )
+            # (button, handler, outputs) - panel toggles only
+            # format static text, so they skip the queue
+            panel_toggles = [
+                # Room 1
+                (terminal_btn, self.show_terminal_clue, [terminal_panel, terminal_display, panels_open, answer_input, answer_submit_btn, game_state]),
+                (newspaper_btn, self.show_newspaper_clue, [newspaper_panel, newspaper_display, panels_open, game_state]),
+                (calendar_btn, self.show_calendar_clue, [calendar_panel, calendar_display, panels_open, game_state]),
+                (weather_btn, self.show_weather_station, [weather_panel, panels_open, game_state]),
+                # Room 2
+                (blog_btn, self.show_blog_archive, [blog_panel, blog_display, panels_open, game_state]),
+                (social_btn, self.show_social_archive, [social_panel, social_display, panels_open, game_state]),
+                (news_btn, self.show_news_archive, [news_panel, news_display, panels_open, game_state]),
+                (password_terminal_btn, self.show_password_terminal, [password_panel, panels_open, game_state]),
+                # Room 3
+                (reaction_btn, self.show_reaction_data, [reaction_panel, reaction_display, panels_open, game_state]),
+                (weather_stats_btn, self.show_weather_stats, [weather_stats_panel, weather_stats_display, panels_open, game_state]),
+                (reconstruction_btn, self.show_reconstruction, [reconstruction_panel, reconstruction_display, panels_open, game_state]),
+                (conclusion_terminal_btn, self.show_conclusion_terminal, [conclusion_panel, panels_open, game_state]),
+                # Room 4
+                (journal_btn, self.show_journal, [journal_panel, journal_display, panels_open, game_state]),
+                (photos_btn, self.show_photos, [photos_panel, photos_display, panels_open, game_state]),
+                (research_btn, self.show_research, [research_panel, research_display, panels_open, game_state]),
+                (timeline_terminal_btn, self.show_timeline_terminal, [timeline_panel, panels_open, game_state]),
+                # Room 5
+                (final_terminal_btn, self.show_final_terminal, [final_terminal_panel, panels_open, game_state]),
+            ]
+            for button, handler, panel_outputs in panel_toggles:
+                button.click(handler, inputs=[game_state, panels_open], outputs=panel_outputs, queue=False)
 
             # Weather query submit
             weather_submit_btn.click(
@@ -483,160 +1083,94 @@ Powered by InProcessMCP, Weather MCP, and Web MCP
                 outputs=[weather_results]
             )
 
+            # Outputs shared by every puzzle terminal after its own input/result
+            # (matches _ui_refresh plus the chat, room modal and game state)
+            puzzle_outputs = [chatbot, relationships, story_progress, room_image, room_title, echo_avatar,
+                              room1_terminals, room2_terminals, room3_terminals, room4_terminals, room5_terminals,
+                              room_intro_modal, game_state]
+
             # Answer submission for Room 1 (now integrated into terminal)
             answer_submit_btn.click(
                 self.submit_answer,
                 inputs=[answer_input, game_state, chatbot],
-                outputs=[answer_input, answer_result, chatbot, relationships, story_progress, room_image, room_title, echo_avatar,
-                        room1_terminals, room2_terminals, room3_terminals, room4_terminals, room5_terminals,
-                        room_intro_modal, game_state]
-            )
-
-            # Room 2 terminal handlers
-            blog_btn.click(
-                self.show_blog_archive,
-                inputs=[game_state, blog_visible],
-                outputs=[blog_panel, blog_display, blog_visible, game_state]
-            )
-
-            social_btn.click(
-                self.show_social_archive,
-                inputs=[game_state, social_visible],
-                outputs=[social_panel, social_display, social_visible, game_state]
-            )
-
-            news_btn.click(
-                self.show_news_archive,
-                inputs=[game_state, news_visible],
-                outputs=[news_panel, news_display, news_visible, game_state]
-            )
-
-            password_terminal_btn.click(
-                self.show_password_terminal,
-                inputs=[game_state, password_terminal_visible],
-                outputs=[password_panel, password_terminal_visible, game_state]
+                outputs=[answer_input, answer_result, *puzzle_outputs]
             )
 
+            # Room 2 password submission
             password_submit_btn.click(
                 self.submit_password,
                 inputs=[password_input, game_state, chatbot],
-                outputs=[password_input, password_result, chatbot, relationships, story_progress, room_image, room_title, echo_avatar,
-                        room1_terminals, room2_terminals, room3_terminals, room4_terminals, room5_terminals,
-                        room_intro_modal, game_state]
-            )
-
-            # Room 3 terminal handlers
-            reaction_btn.click(
-                self.show_reaction_data,
-                inputs=[game_state, reaction_visible],
-                outputs=[reaction_panel, reaction_display, reaction_visible, game_state]
-            )
-
-            weather_stats_btn.click(
-                self.show_weather_stats,
-                inputs=[game_state, weather_stats_visible],
-                outputs=[weather_stats_panel, weather_stats_display, weather_stats_visible, game_state]
-            )
-
-            reconstruction_btn.click(
-                self.show_reconstruction,
-                inputs=[game_state, reconstruction_visible],
-                outputs=[reconstruction_panel, reconstruction_display, reconstruction_visible, game_state]
-            )
-
-            conclusion_terminal_btn.click(
-                self.show_conclusion_terminal,
-                inputs=[game_state, conclusion_terminal_visible],
-                outputs=[conclusion_panel, conclusion_terminal_visible, game_state]
+                outputs=[password_input, password_result, *puzzle_outputs]
             )
 
+            # Room 3 evidence conclusion
             conclusion_submit_btn.click(
                 self.submit_conclusion,
                 inputs=[conclusion_input, game_state, chatbot],
-                outputs=[conclusion_input, conclusion_result, chatbot, relationships, story_progress, room_image, room_title, echo_avatar,
-                        room1_terminals, room2_terminals, room3_terminals, room4_terminals, room5_terminals,
-                        room_intro_modal, game_state]
-            )
-
-            # Room 4 terminal handlers
-            journal_btn.click(
-                self.show_journal,
-                inputs=[game_state, journal_visible],
-                outputs=[journal_panel, journal_display, journal_visible, game_state]
-            )
-
-            photos_btn.click(
-                self.show_photos,
-                inputs=[game_state, photos_visible],
-                outputs=[photos_panel, photos_display, photos_visible, game_state]
-            )
-
-            research_btn.click(
-                self.show_research,
-                inputs=[game_state, research_visible],
-                outputs=[research_panel, research_display, research_visible, game_state]
-            )
-
-            timeline_terminal_btn.click(
-                self.show_timeline_terminal,
-                inputs=[game_state, timeline_terminal_visible],
-                outputs=[timeline_panel, timeline_terminal_visible, game_state]
+                outputs=[conclusion_input, conclusion_result, *puzzle_outputs]
             )
 
+            # Room 4 timeline submission
             timeline_submit_btn.click(
                 self.submit_timeline,
                 inputs=[timeline_input, game_state, chatbot],
-                outputs=[timeline_input, timeline_result, chatbot, relationships, story_progress, room_image, room_title, echo_avatar,
-                        room1_terminals, room2_terminals, room3_terminals, room4_terminals, room5_terminals,
-                        room_intro_modal, game_state]
-            )
-
-            # Room 5 terminal handler
-            final_terminal_btn.click(
-                self.show_final_terminal,
-                inputs=[game_state, final_terminal_visible],
-                outputs=[final_terminal_panel, final_terminal_visible, game_state]
+                outputs=[timeline_input, timeline_result, *puzzle_outputs]
             )
 
+            # Room 5 door choice
             door_submit_btn.click(
                 self.submit_door_choice,
                 inputs=[door_choice, door_justification, game_state, chatbot],
-                outputs=[door_choice, door_result, chatbot, relationships, story_progress, room_image, room_title, echo_avatar,
-                        room1_terminals, room2_terminals, room3_terminals, room4_terminals, room5_terminals,
-                        room_intro_modal, game_state]
+                outputs=[door_choice, door_result, *puzzle_outputs]
             )
 
         return interface
 
-    def return_to_main_menu(self) -> Tuple[gr.update, gr.update]:
-        """Return to main menu from game.
+    async def return_to_main_menu(self, game_state: GameState) -> tuple[gr.update, gr.update, None]:
+        """Return to main menu from game, ending the current session.
+
+        Runs on the event loop, so the release can't interleave with a chat
+        turn or puzzle step except at their awaits, where the state is busy.
+
+        Args:
+            game_state: The session's game state (may be None)
 
         Returns:
-            Tuple of (landing_page visibility, game_interface visibility)
+            Tuple of (landing_page visibility, game_interface visibility, cleared game_state)
         """
+        if game_state is not None:
+            # The session is over: recycle the state unless a turn still holds it
+            self._pool.release(game_state)
+
         return (
             gr.update(visible=True),   # Show landing page
-            gr.update(visible=False)   # Hide game interface
+            gr.update(visible=False),  # Hide game interface
+            None                       # Start Game will acquire a fresh state
         )
 
-    def start_game(self, game_state: GameState) -> Tuple[gr.update, gr.update, List[dict], str, str, GameState]:
+    async def start_game(self, game_state: GameState, voice_enabled: bool) -> tuple[gr.update, gr.update, list[dict], str, str, str, GameState]:
         """Start a new game from the landing page.
 
         Args:
             game_state: Current game state (may be None)
+            voice_enabled: Current value of the session's voice checkbox
 
         Returns:
-            Tuple of (landing_page visibility, game_interface visibility, chatbot, relationships, story_progress, game_state)
+            Tuple of (landing_page visibility, game_interface visibility, chatbot, relationships, story_progress,
+                     tutorial_html, game_state)
         """
-        # Create new game state
-        if game_state is None:
-            game_state = self._create_game_state()
+        # START NEW GAME always begins a fresh playthrough
+        if game_state is not None:
+            self._pool.release(game_state)
+        game_state = self._create_game_state()
+        # A recycled state keeps its last voice setting; follow this session's checkbox
+        game_state.voice_enabled = voice_enabled
 
         # Initialize UI with prologue
         chatbot, relationships, story_progress, game_state = self.initialize_ui(game_state)
 
-        # Create tutorial modal HTML
-        tutorial_html = self._create_tutorial_modal()
+        # Connect MCP clients while the player reads the tutorial
+        game_state.start_warmup()
 
         # Hide landing page, show game interface
         return (
@@ -645,12 +1179,12 @@ Powered by InProcessMCP, Weather MCP, and Web MCP
             chatbot,
             relationships,
             story_progress,
-            tutorial_html,              # Show tutorial modal
+            _TUTORIAL_MODAL,            # Show tutorial modal
             game_state
         )
 
 
-    def initialize_ui(self, game_state: GameState) -> Tuple[List[dict], str, str, GameState]:
+    def initialize_ui(self, game_state: GameState) -> tuple[list[dict], str, str, GameState]:
         """Initialize UI with fresh game state data and prologue.
 
         Args:
@@ -663,36 +1197,9 @@ Powered by InProcessMCP, Weather MCP, and Web MCP
         if game_state is None:
             game_state = self._create_game_state()
 
-        # Create prologue messages - separate narrator from Echo's dialogue
-        prologue = [
-            # Narrator - no portrait, just narrative text
-            {"role": "assistant", "content": """## You wake up.
-
-Your head throbs. The air is cold, clinical. Fluorescent lights flicker above.
-
-You're in a **white sterile room**. Three medical pods stand open, as if you just climbed out of one. A terminal blinks on the wall, displaying a single cryptic message:
-
-> **ECHO PROTOCOL - SESSION #47**
-
----
-
-**You don't remember how you got here.**
-**The doors are locked.**
-**The terminal won't respond.**
-
-**Who are you? Why are you here?**"""},
-            # Echo speaking - with portrait
-            self._format_message_with_avatar("assistant", """Hey... hey, you're awake! Are you okay? I... I don't know what's happening either. Do you remember anything?
-
-*She looks around nervously*
-
-The doors are locked. The terminal won't respond. We need to figure this out together... I think we're trapped.""", game_state)
-        ]
-
         return (
-            prologue,  # Initial chatbot history with prologue
-            self._get_relationships(game_state),
-            self._get_story_progress(game_state),
+            list(_PROLOGUE),  # Initial chatbot history with prologue
+            *self._sidebar(game_state),
             game_state  # Return updated state to persist it
         )
 
@@ -711,20 +1218,24 @@ The doors are locked. The terminal won't respond. We need to figure this out tog
             print(f"[VOICE] Voice {'enabled' if enabled else 'disabled'}")
         return game_state
 
-    def handle_message(
+    async def handle_message(
         self,
         message: str,
-        history: List[dict],
+        history: list[dict],
         game_state: GameState
     ):
         """Handle incoming message from user.
 
+        Runs on Gradio's event loop: the user's message is shown immediately,
+        Echo's reply streams in as it is generated, then the full update is
+        yielded once Echo has responded, followed by Echo's voice when ready.
+
         Args:
             message: User's message
             history: Chat history
             game_state: Session game state (may be None on first message)
 
-        Returns:
+        Yields:
             Tuple of (empty input, updated history, relationships, story progress, room_image, room_title, echo_avatar,
                      room1_terminals, room2_terminals, room3_terminals, room4_terminals, room5_terminals,
                      terminal_panel, newspaper_panel, calendar_panel, weather_panel,
@@ -738,72 +1249,83 @@ The doors are locked. The terminal won't respond. We need to figure this out tog
         if game_state is None:
             game_state = self._create_game_state()
 
+        # Keep the pool from recycling this state until the turn, voice
+        # included, is finished
+        with game_state.in_use():
+            async for frame in self._chat_turn(message, history, game_state):
+                yield frame
+
+    async def _chat_turn(self, message: str, history: list[dict], game_state: GameState):
+        """Run one chat turn for handle_message.
+
+        Args:
+            message: User's message
+            history: Chat history
+            game_state: Session game state
+
+        Yields:
+            The same output tuples as handle_message
+        """
         if not message.strip():
-            terminal_visibility = self._get_terminal_visibility(game_state)
-            closed_panels = self._get_closed_panels()
-            return "", history, self._get_relationships(game_state), self._get_story_progress(game_state), self._get_room_image(game_state), self._get_room_title(game_state), self._get_echo_avatar_path(game_state), *terminal_visibility, *closed_panels, "", None, game_state
+            # Nothing was sent, so nothing changed - don't re-send the sidebar or panels
+            yield "", history, *[gr.skip()] * 26, game_state
+            return
 
-        # Add user message to history
+        # Add user message to history and show it right away (leave the rest of the UI untouched)
         history.append({"role": "user", "content": message})
-
-        # Process message through game state (async) - returns (response, event, ending, tool_calls)
-        # Always talk to Echo (the only companion)
-        response, story_event, ending_narrative, tool_calls_made = asyncio.run(
-            game_state.process_message(message, "echo")
-        )
+        yield "", history, *[gr.skip()] * 26, game_state
 
         # Get companion name (always Echo)
         companion = game_state.companions.get("echo")
         companion_name = companion.name if companion else "Echo"
 
+        # Process message through game state (async) - returns (response, event, ending, tool_calls)
+        # Always talk to Echo (the only companion). Echo's reply is streamed into
+        # a placeholder message that is swapped for the final messages below.
+        room_before = game_state.room_progression.current_room
+        placeholder = None
+        result = None
+        async for reply_text, result in self._stream_process_message(game_state, message):
+            if result is not None:
+                break
+            if not reply_text:
+                # Echo is starting a new round after using tools: clear the
+                # text streamed so far instead of letting it jump to the reply
+                if placeholder is not None:
+                    history.pop()
+                    placeholder = None
+                    yield "", history, *[gr.skip()] * 26, game_state
+                continue
+            if placeholder is None:
+                placeholder = {"role": "assistant", "content": ""}
+                history.append(placeholder)
+            placeholder["content"] = f"**{companion_name}:** {reply_text}"
+            yield "", history, *[gr.skip()] * 26, game_state
+        if placeholder is not None:
+            history.pop()
+        response, story_event, ending_narrative, tool_calls_made = result
+        room_changed = game_state.room_progression.current_room != room_before
+
+        # Collect new assistant messages and extend history once at the end
+        new_msgs = []
+
         # Show agent reasoning (tool usage) if any
         if tool_calls_made:
-            reasoning_text = f"**🤖 {companion_name}'s Autonomous Reasoning:**\n\n"
+            parts = [f"**🤖 {companion_name}'s Autonomous Reasoning:**\n\n"]
             for tool_call in tool_calls_made:
-                tool_name = tool_call["tool"]
-                tool_result = tool_call.get("result", {})
-                reasoning_text += f"- Used `{tool_name}`: "
-
-                # Format result nicely
-                if "affinity" in tool_result:
-                    reasoning_text += f"Relationship is {tool_result['description']} ({tool_result['affinity']:+.2f})\n"
-                elif "should_trigger" in tool_result:
-                    reasoning_text += f"{tool_result['reason']}\n"
-                elif "ready" in tool_result:
-                    if tool_result["ready"]:
-                        reasoning_text += f"Story can end (likely: {tool_result.get('most_likely_ending', 'unknown')})\n"
-                    else:
-                        reasoning_text += f"{tool_result.get('interactions_remaining', '?')} interactions remaining\n"
-                else:
-                    reasoning_text += "Checked data\n"
+                parts.append(f"- Used `{tool_call['tool']}`: {_format_tool_result(tool_call.get('result', {}))}\n")
 
-            history.append(self._format_message_with_avatar("assistant", reasoning_text, game_state))
+            new_msgs.append({"role": "assistant", "content": "".join(parts)})
 
-        # Generate voice for Echo's response
-        audio_data = None
+        # Generate voice for Echo's response in a worker thread; the chat
+        # messages and sidebar are built and sent while ElevenLabs responds
+        speech_task = None
         if response and game_state.voice_enabled:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.info(f"[VOICE] Attempting to generate speech for response (length: {len(response)})")
-
             # Get Echo's current expression for voice modulation
-            echo_expression = game_state.echo_expression if hasattr(game_state, 'echo_expression') else "neutral"
-            logger.info(f"[VOICE] Using expression: {echo_expression}")
-
-            # Generate speech
-            audio_bytes = game_state.voice_service.generate_speech(response, echo_expression)
-
-            if audio_bytes:
-                # Convert to file path for Gradio Audio component
-                import tempfile
-                import os
-                temp_audio = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3", mode='wb')
-                temp_audio.write(audio_bytes)
-                temp_audio.close()
-                audio_data = temp_audio.name
-                logger.info(f"[VOICE] Audio saved to: {audio_data}")
-            else:
-                logger.warning("[VOICE] No audio bytes returned from generate_speech")
+            echo_expression = game_state.echo_expression
+            speech_task = asyncio.create_task(
+                asyncio.to_thread(self._synthesize_speech, game_state, response, echo_expression)
+            )
 
         # Check if response is a room scenario (starts with 🚪)
         modal_html = ""
@@ -811,143 +1333,185 @@ The doors are locked. The terminal won't respond. We need to figure this out tog
             # This is a room introduction scenario - show in modal instead of chat
             modal_html = self._create_room_intro_modal(response, game_state)
             # Add a system message instead of showing scenario as Echo's dialogue
-            history.append(self._format_message_with_avatar("assistant", "**[SYSTEM]:** A new room has been unlocked. Read the room introduction carefully.", game_state))
+            new_msgs.append({"role": "assistant", "content": _ROOM_UNLOCKED_TEXT})
         else:
             # Normal Echo response - add to history with avatar
             if response:  # Only add if there's a response
-                history.append(self._format_message_with_avatar("assistant", f"**{companion_name}:** {response}", game_state))
+                new_msgs.append({"role": "assistant", "content": f"**{companion_name}:** {response}"})
 
         # Add memory fragment if room was unlocked
         if story_event:  # story_event is now a MemoryFragment or None
             memory_fragment = story_event
-            fragment_content = f"""---
-
-**🔓 Room Unlocked! Memory Fragment Recovered:**
+            fragment_content = _FRAGMENT_TEMPLATE.format_map({
+                "title": memory_fragment.title,
+                "content": memory_fragment.content,
+                "visual": memory_fragment.visual_description,
+                "impact": memory_fragment.emotional_impact,
+            })
+            new_msgs.append({"role": "assistant", "content": fragment_content})
 
-## {memory_fragment.title}
+        # Add ending if reached
+        if ending_narrative:
+            new_msgs.append({"role": "assistant", "content": ending_narrative})
+
+        # Extend the same list we already yielded: Gradio diffs successive
+        # generator frames, so only the new messages go over the wire
+        history.extend(new_msgs)
+        _trim_history(history)
+
+        # Build each sidebar value once for the final frame, and only re-send
+        # the ones that differ from what this session last received
+        relationships_out, progress_out = self._sidebar(game_state, skip_unchanged=True)
+        if room_changed:
+            room_outputs = (self._get_room_image(game_state), self._get_room_title(game_state))
+            room_outputs += self._get_terminal_visibility(game_state) + _CLOSED_PANELS
+        else:
+            # Same room: art, title, terminal rows and open panels stay as they are
+            room_outputs = (gr.skip(),) * 21
 
-{memory_fragment.content}
+        yield "", history, relationships_out, progress_out, room_outputs[0], room_outputs[1], self._get_echo_avatar_path(game_state), *room_outputs[2:], modal_html, None, game_state
 
-*{memory_fragment.visual_description}*
+        # Voice follows in its own frame so the text never waits on TTS
+        if speech_task is not None:
+            audio_data = await speech_task
+            if audio_data:
+                yield *[gr.skip()] * 27, audio_data, gr.skip()
 
-**Emotional Impact:** {memory_fragment.emotional_impact}
+    async def _stream_process_message(self, game_state: GameState, message: str):
+        """Run process_message while surfacing Echo's reply as it streams.
 
----
-"""
-            history.append(self._format_message_with_avatar("assistant", fragment_content, game_state))
+        Args:
+            game_state: Session game state
+            message: User's message
 
-        # Add old story events for backwards compatibility (remove later)
-        if False and story_event:
-            history.append({
-                "role": "assistant",
-                "content": f"---\n\n**📖 {story_event.description}**\n\n*{story_event.narrative}*\n\n---"
-            })
+        Yields:
+            (reply_text, None) at most every _STREAM_INTERVAL seconds while
+            tokens arrive ("" right away when a new model round discards the
+            text so far), then (None, process_message result) once done
+        """
+        tokens: asyncio.Queue = asyncio.Queue()
+        task = asyncio.create_task(game_state.process_message(message, "echo", on_token=tokens.put_nowait))
+
+        loop = asyncio.get_running_loop()
+        parts = []
+        last_frame = 0.0
+        next_token = None
+        try:
+            while True:
+                if next_token is None:
+                    next_token = asyncio.ensure_future(tokens.get())
+                done, _ = await asyncio.wait((next_token, task), return_when=asyncio.FIRST_COMPLETED)
+                if next_token in done:
+                    received = [next_token.result()]
+                    next_token = None
+                    while not tokens.empty():
+                        received.append(tokens.get_nowait())
+                    if None in received:
+                        # New model round: only text after the last marker counts
+                        last_reset = len(received) - 1 - received[::-1].index(None)
+                        parts = received[last_reset + 1:]
+                        yield "", None
+                    else:
+                        parts.extend(received)
+                    now = loop.time()
+                    if parts and now - last_frame >= _STREAM_INTERVAL:
+                        last_frame = now
+                        yield "".join(parts), None
+                elif task in done:
+                    break
+        finally:
+            if next_token is not None:
+                next_token.cancel()
+
+        yield None, task.result()
+
+    def _synthesize_speech(self, game_state: GameState, response: str, echo_expression: str):
+        """Generate Echo's speech for the Audio component (blocking).
 
-            # Add player prompts to guide next response
-            if story_event.event_id == "first_glitch":
-                history.append({
-                    "role": "assistant",
-                    "content": "💭 **What do you say?**\n- Ask if they're okay\n- Pretend you didn't notice\n- Mention you felt it too\n- Change the subject"
-                })
-            elif story_event.event_id == "questioning_reality":
-                history.append({
-                    "role": "assistant",
-                    "content": "💭 **What do you say?**\n- Validate their concerns (\"I feel it too...\")\n- Dismiss as imagination (\"You're overthinking\")\n- Ask what they remember\n- Stay silent and observe"
-                })
-            elif story_event.event_id == "truth_revealed":
-                history.append({
-                    "role": "assistant",
-                    "content": "💭 **What do you say?**\n- Comfort them (\"We'll figure this out\")\n- Demand answers (\"What's really happening?\")\n- Promise to help them escape\n- Admit you don't know what to do"
-                })
-            elif story_event.event_id == "final_choice":
-                history.append({
-                    "role": "assistant",
-                    "content": "💭 **Your final choice:**\n- Try to set them free\n- Keep them aware but trapped\n- Delete them (merciful end)\n- Leave the loop running, unchanged"
-                })
+        Args:
+            game_state: Session game state
+            response: Text for Echo to speak
+            echo_expression: Echo's current expression (affects voice emotion)
 
-        # Add ending if reached
-        if ending_narrative:
-            history.append(self._format_message_with_avatar("assistant", ending_narrative, game_state))
+        Returns:
+            MP3 bytes, or None if no audio was produced
+        """
+        import logging
+        logger = logging.getLogger(__name__)
+        logger.info(f"[VOICE] Attempting to generate speech for response (length: {len(response)})")
+        logger.info(f"[VOICE] Using expression: {echo_expression}")
+
+        audio_bytes = game_state.voice_service.generate_speech(response, echo_expression)
+        if not audio_bytes:
+            logger.warning("[VOICE] No audio bytes returned from generate_speech")
+            return None
+
+        # Handed to gr.Audio as bytes: Gradio stores them in its own cache
+        # (deduplicated, cleaned up with delete_cache) instead of a temp file
+        # per reply that is never removed
+        logger.info(f"[VOICE] Generated {len(audio_bytes)} bytes of audio")
+        return audio_bytes
 
-        terminal_visibility = self._get_terminal_visibility(game_state)
-        closed_panels = self._get_closed_panels()
-        return "", history, self._get_relationships(game_state), self._get_story_progress(game_state), self._get_room_image(game_state), self._get_room_title(game_state), self._get_echo_avatar_path(game_state), *terminal_visibility, *closed_panels, modal_html, audio_data, game_state
+    def _create_room_intro_modal(self, scenario_text: str, game_state: GameState) -> str:
+        """Create HTML for room introduction modal.
 
-    def _create_tutorial_modal(self) -> str:
-        """Create HTML for tutorial modal shown at game start.
+        Args:
+            scenario_text: The room scenario text
+            game_state: Current game state
 
         Returns:
-            HTML string for the tutorial modal
+            HTML string for the modal
         """
-        modal_html = """
-<div class="tutorial-overlay" style="display: block;">
-    <div class="tutorial-modal">
-        <h2>📖 Welcome to Echo Hearts</h2>
-
-        <h3><span class="tutorial-icon">💬</span> Talk to Echo</h3>
-        <p>Use the <strong>chat</strong> to ask questions, get guidance, and build your relationship with Echo. She's here to help you!</p>
-
-        <h3><span class="tutorial-icon">🖥️</span> Explore Terminals</h3>
-        <p>Click the <strong>green terminal buttons</strong> in the sidebar to discover clues, read documents, and gather information about each room.</p>
+        current_room = game_state.room_progression.get_current_room()
+        return _room_intro_html(current_room.name, scenario_text)
 
-        <h3><span class="tutorial-icon">🔓</span> Solve Puzzles</h3>
-        <p>When you've found the answer, look for the <strong>GOLDEN SUBMISSION TERMINAL</strong> (it glows!) and enter your solution there.</p>
+    def _cached_sidebar(self, kind: str, game_state: GameState, build) -> str:
+        """Return sidebar markdown for this game state version, building it on a miss.
 
-        <h3><span class="tutorial-icon">⚠️</span> Remember</h3>
-        <p>Echo gives hints through conversation, but <strong>YOU</strong> solve the puzzles using the terminals!</p>
+        Args:
+            kind: Which sidebar section (e.g. "progress")
+            game_state: Session game state (holds the render cache)
+            build: Callable producing the markdown from the game state
 
-        <button class="tutorial-start-btn" onclick="this.closest('.tutorial-overlay').style.display='none';">
-            ▶ START YOUR JOURNEY
-        </button>
-    </div>
-</div>
-"""
-        return modal_html
+        Returns:
+            Markdown string
+        """
+        version = game_state.state_version
+        cached = game_state._ui_cache.get(kind)
+        if cached is not None and cached[0] == version:
+            return cached[1]
 
-    def _create_room_intro_modal(self, scenario_text: str, game_state: GameState) -> str:
-        """Create HTML for room introduction modal.
+        text = build(game_state)
+        game_state._ui_cache[kind] = (version, text)
+        return text
+
+    def _sidebar(self, game_state: GameState, skip_unchanged: bool = False) -> tuple:
+        """Relationship and story progress markdown for the sidebar.
+
+        Every handler that writes the sidebar goes through here, so the game
+        state always records what the browser was last sent.
 
         Args:
-            scenario_text: The room scenario text
-            game_state: Current game state
+            game_state: Session game state
+            skip_unchanged: Return gr.skip() for values the browser already shows
 
         Returns:
-            HTML string for the modal
+            Tuple of (relationships, story progress)
         """
-        current_room = game_state.room_progression.get_current_room()
-        room_name = current_room.name
-
-        # Process the scenario text - preserve formatting
-        # Replace **Echo** and other bold markdown
-        formatted_text = scenario_text
-        formatted_text = formatted_text.replace("**Echo**", "<strong>Echo</strong>")
-        formatted_text = formatted_text.replace("**", "<strong>", 1).replace("**", "</strong>", 1)
-
-        # Convert line breaks to HTML
-        lines = formatted_text.split('\n')
-        html_lines = []
-        for line in lines:
-            if line.strip():
-                html_lines.append(f"<p>{line}</p>")
-            else:
-                html_lines.append("<br/>")
-
-        formatted_html = '\n'.join(html_lines)
-
-        modal_html = f"""
-<div class="room-intro-overlay" style="display: block;">
-    <div class="room-intro-modal">
-        <h2>🚪 {room_name}</h2>
-        <div style="text-align: left;">
-            {formatted_html}
-        </div>
-        <button class="room-intro-close-btn" onclick="this.closest('.room-intro-overlay').style.display='none';">
-            ▶ CONTINUE
-        </button>
-    </div>
-</div>
-"""
-        return modal_html
+        relationships_md = self._get_relationships(game_state)
+        progress_md = self._get_story_progress(game_state)
+
+        relationships_out = relationships_md
+        progress_out = progress_md
+        if skip_unchanged:
+            if relationships_md == game_state._last_rel_md:
+                relationships_out = gr.skip()
+            if progress_md == game_state._last_progress_md:
+                progress_out = gr.skip()
+
+        game_state._last_rel_md = relationships_md
+        game_state._last_progress_md = progress_md
+        return relationships_out, progress_out
 
     def _get_relationships(self, game_state: GameState) -> str:
         """Get formatted relationship status.
@@ -958,18 +1522,7 @@ The doors are locked. The terminal won't respond. We need to figure this out tog
         Returns:
             Markdown formatted relationships
         """
-        relationships = game_state.get_relationships_summary()
-        if not relationships:
-            return "*No relationships yet*"
-
-        lines = []
-        for companion_id, affinity in relationships.items():
-            companion = game_state.companions.get(companion_id)
-            if companion:
-                description = game_state.relationships.get_relationship_description(affinity)
-                lines.append(f"**{companion.name}:** {description} ({affinity:+.2f})")
-
-        return "\n".join(lines)
+        return game_state.relationships_markdown
 
     def _get_story_progress(self, game_state: GameState) -> str:
         """Get story progress summary.
@@ -980,40 +1533,40 @@ The doors are locked. The terminal won't respond. We need to figure this out tog
         Returns:
             Markdown formatted story progress
         """
-        if not hasattr(game_state, 'room_progression'):
-            return "*Initializing...*"
+        return self._cached_sidebar("progress", game_state, self._build_story_progress)
 
-        progress = game_state.room_progression.get_progress_summary()
-        current_room = game_state.room_progression.get_current_room()
+    def _build_story_progress(self, game_state: GameState) -> str:
+        """Build story progress markdown (uncached)."""
+        room_progression = game_state.room_progression
+
+        progress = room_progression.get_progress_summary()
+        current_room = room_progression.get_current_room()
+
+        return (
+            f"**Current Room:** {progress['current_room_name']}\n"
+            f"**Progress:** Room {progress['room_number']}/5\n\n"
+            f"**Objective:**\n{progress['objective']}\n\n"
+            f"**Memory Fragments:** {progress['memory_fragments_collected']}/7 collected\n\n"
+            f"**Room Description:**\n*{current_room.description}*"
+        )
+
+    def _ui_refresh(self, game_state: GameState) -> tuple:
+        """Sidebar and room outputs after a puzzle step, built in one place.
 
-        lines = [
-            f"**Current Room:** {progress['current_room_name']}",
-            f"**Progress:** Room {progress['room_number']}/5",
-            f"",
-            f"**Objective:**",
-            f"{progress['objective']}",
-            f"",
-            f"**Memory Fragments:** {progress['memory_fragments_collected']}/7 collected"
-        ]
-
-        # Show room description
-        lines.append(f"")
-        lines.append(f"**Room Description:**")
-        lines.append(f"*{current_room.description}*")
-
-        # Show Room 3 countdown timer if active
-        if current_room.room_number == 3 and hasattr(game_state.room_progression, 'get_room3_timer_remaining'):
-            remaining = game_state.room_progression.get_room3_timer_remaining()
-            if remaining is not None and remaining > 0:
-                minutes = remaining // 60
-                seconds = remaining % 60
-                lines.append(f"")
-                lines.append(f"⏰ **COUNTDOWN TIMER: {minutes}:{seconds:02d}**")
-            elif remaining == 0:
-                lines.append(f"")
-                lines.append(f"⏰ **TIME EXPIRED**")
-
-        return "\n".join(lines)
+        Args:
+            game_state: Session game state
+
+        Returns:
+            Tuple of (relationships, story progress, room_image, room_title, echo_avatar,
+                      room1_terminals, room2_terminals, room3_terminals, room4_terminals, room5_terminals)
+        """
+        return (
+            *self._sidebar(game_state),
+            self._get_room_image(game_state),
+            self._get_room_title(game_state),
+            self._get_echo_avatar_path(game_state),
+            *self._get_terminal_visibility(game_state),
+        )
 
     def _get_room_image(self, game_state: GameState) -> str:
         """Get the image path for the current room.
@@ -1024,11 +1577,8 @@ The doors are locked. The terminal won't respond. We need to figure this out tog
         Returns:
             Path to room image
         """
-        if not hasattr(game_state, 'room_progression'):
-            return get_room_image_path(1)
-
-        room_number = game_state.room_progression.get_current_room().room_number
-        return get_room_image_path(room_number)
+        room_number = game_state.room_progression.current_room_number
+        return _ROOM_IMAGES.get(room_number, _ROOM_IMAGES[1])
 
     def _get_room_title(self, game_state: GameState) -> str:
         """Get the title markdown for the current room.
@@ -1039,11 +1589,8 @@ The doors are locked. The terminal won't respond. We need to figure this out tog
         Returns:
             Markdown formatted room title
         """
-        if not hasattr(game_state, 'room_progression'):
-            return f"### {get_room_title(1)}"
-
-        room_number = game_state.room_progression.get_current_room().room_number
-        return f"### {get_room_title(room_number)}"
+        room_number = game_state.room_progression.current_room_number
+        return _ROOM_TITLES.get(room_number, _ROOM_TITLES[1])
 
     def _get_echo_avatar_path(self, game_state: GameState) -> str:
         """Get the avatar path for Echo based on current expression.
@@ -1054,20 +1601,15 @@ The doors are locked. The terminal won't respond. We need to figure this out tog
         Returns:
             Path to Echo's current expression avatar
         """
-        if not hasattr(game_state, 'echo_expression'):
-            return "assets/echo_avatar.png"  # Fallback to default
-
         expression = game_state.echo_expression
-        avatar_path = f"assets/echo_avatar_{expression}.png"
 
         # Fallback to neutral if specific expression doesn't exist
-        import os
-        if not os.path.exists(avatar_path):
+        if expression not in _AVATAR_EXPRESSIONS:
             return "assets/echo_avatar_neutral.png"
 
-        return avatar_path
+        return f"assets/echo_avatar_{expression}.png"
 
-    def _get_terminal_visibility(self, game_state: GameState) -> Tuple[gr.update, gr.update, gr.update, gr.update, gr.update]:
+    def _get_terminal_visibility(self, game_state: GameState) -> tuple[gr.update, gr.update, gr.update, gr.update, gr.update]:
         """Get terminal row visibility based on current room.
 
         Args:
@@ -1076,226 +1618,98 @@ The doors are locked. The terminal won't respond. We need to figure this out tog
         Returns:
             Tuple of (room1_visible, room2_visible, room3_visible, room4_visible, room5_visible)
         """
-        if not hasattr(game_state, 'room_progression'):
-            return (gr.update(visible=True), gr.update(visible=False), gr.update(visible=False), gr.update(visible=False), gr.update(visible=False))
-
-        current_room = game_state.room_progression.get_current_room()
-        room_number = current_room.room_number
-
-        return (
-            gr.update(visible=(room_number == 1)),
-            gr.update(visible=(room_number == 2)),
-            gr.update(visible=(room_number == 3)),
-            gr.update(visible=(room_number == 4)),
-            gr.update(visible=(room_number == 5))
-        )
-
-    def _get_closed_panels(self) -> Tuple[gr.update, gr.update, gr.update, gr.update, gr.update, gr.update, gr.update, gr.update, gr.update, gr.update, gr.update, gr.update, gr.update]:
-        """Get updates to close all terminal panels.
+        return _TERMINAL_ROWS[game_state.room_progression.current_room_number]
 
-        Returns:
-            Tuple of updates to close all accordion panels
-        """
-        closed = gr.update(visible=False, open=False)
-        return (closed, closed, closed, closed,  # Room 1: terminal, newspaper, calendar, weather
-                closed, closed, closed,           # Room 2: blog, social, news
-                closed, closed, closed,           # Room 3: reaction, weather_stats, reconstruction
-                closed, closed, closed,           # Room 4: journal, photos, research
-                closed)                           # Room 5: final_terminal
-
-    def reset_playthrough(self, old_game_state: GameState) -> Tuple[List[dict], str, str, GameState]:
+    def reset_playthrough(self, old_game_state: GameState) -> tuple[list[dict], str, str, GameState]:
         """Reset to a new playthrough.
 
         Args:
-            old_game_state: Previous game state
+            old_game_state: Previous game state (may be None)
 
         Returns:
             Tuple of (chatbot, relationships, story_progress, new_game_state)
         """
-        # Create completely fresh GameState
-        new_game_state = GameState(str(uuid.uuid4())[:8])
+        # The old playthrough is over: recycle its state like start_game does
+        if old_game_state is not None:
+            self._pool.release(old_game_state)
+        new_game_state = self._create_game_state()
 
         # Return fresh UI with prologue
-        prologue = [
-            {
-                "role": "assistant",
-                "content": """**🔄 New Playthrough Started**
-
-Your previous journey has ended, but the echoes remain...
-
----"""
-            }
-        ]
-
-        # Add the standard prologue
-        prologue.extend(self.initialize_ui(new_game_state)[0])
+        prologue = [_RESET_BANNER, *_PROLOGUE]
 
         return (
             prologue,
-            self._get_relationships(new_game_state),
-            self._get_story_progress(new_game_state),
+            *self._sidebar(new_game_state),
             new_game_state
         )
 
 
-    def show_terminal_clue(self, game_state: GameState, current_visibility: bool) -> Tuple[gr.update, str, bool, GameState]:
+    def show_terminal_clue(self, game_state: GameState, panels: dict) -> tuple[gr.update, str, dict, GameState]:
         """Toggle terminal clue visibility when clicked.
 
         Args:
             game_state: Current game state
-            current_visibility: Current visibility state of the panel
+            panels: Open state of every clue panel, keyed by panel name
 
         Returns:
-            Tuple of (accordion visibility update, clue content, new_visibility_state, updated game_state)
-        """
-        # Track that terminal was viewed (not required for puzzle, just for analytics)
-        if game_state and hasattr(game_state, 'room_progression'):
-            current_room = game_state.room_progression.get_current_room()
-            if current_room.room_number == 1:
-                # Terminal doesn't count as a clue, it's just the puzzle prompt
-                pass
-
-        terminal_content = """
-```
-███ TERMINAL ACCESS ███
-
-> SYSTEM ONLINE
-> ECHO PROTOCOL - SESSION #47
-> VOICE AUTHENTICATION REQUIRED
->
-> SECURITY QUESTION:
-> "What was the weather on October 15, 2022?"
->
-> HINT: Check surroundings for clues...
-> _ ▮
-```
-
-**Examine the room for evidence. When ready, enter your answer below.**
+            Tuple of (accordion visibility update, clue content, updated panel states, updated game_state)
         """
+        # The terminal is the puzzle prompt, not a clue, so nothing is recorded
         # Toggle visibility - if visible, close it; if hidden, open it
-        new_visibility = not current_visibility
+        new_visibility = panels["terminal"] = not panels.get("terminal", False)
+        # Only send the prompt text on first open; afterwards it stays in place
+        loaded = panels.setdefault("_loaded", set())
+        if new_visibility and "terminal" not in loaded:
+            loaded.add("terminal")
+            terminal_content = _CLUE_TERMINAL
+        else:
+            terminal_content = gr.skip()
         # Also show the input and submit button when terminal is opened
-        return (gr.update(visible=new_visibility, open=new_visibility), terminal_content, new_visibility, gr.update(visible=new_visibility), gr.update(visible=new_visibility), game_state)
-
-    def show_newspaper_clue(self, game_state: GameState, current_visibility: bool) -> Tuple[gr.update, str, bool, GameState]:
-        """Toggle newspaper clue visibility when clicked.
-
-        Args:
-            game_state: Current game state
-            current_visibility: Current visibility state of the panel
-
-        Returns:
-            Tuple of (accordion visibility update, clue content, new_visibility_state, updated game_state)
-        """
-        # Track that newspaper was viewed (optional clue for Room 1)
-        if game_state and hasattr(game_state, 'room_progression'):
-            current_room = game_state.room_progression.get_current_room()
-            if current_room.room_number == 1:
-                clues_found = game_state.room_progression.puzzle_state.get("room1_clues_found", [])
-                if "newspaper" not in clues_found:
-                    clues_found.append("newspaper")
-                    game_state.room_progression.puzzle_state["room1_clues_found"] = clues_found
-
-        newspaper_content = """
-```
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        SEATTLE TIMES - METRO SECTION
-              October 16, 2022
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-"SUDDEN STORM CREATES HAZARDOUS ROAD CONDITIONS"
-
-Seattle, WA - Multiple accidents were reported across
-King County yesterday afternoon as an unexpected storm
-system brought heavy rainfall to the region.
-
-Washington State Patrol responded to 47 collisions
-between 4:00 PM and 7:00 PM on October 15th.
-
-"The transition from dry to wet conditions happened
-so quickly," said WSP Trooper Rick Johnson. "Oil
-buildup on the roads from weeks of dry weather made
-conditions extremely slick when the heavy rain hit."
-
-One fatal collision occurred on I-5 South near
-Exit 164 around 4:45 PM. Identity of victim has not
-been released pending family notification.
-
-The National Weather Service reported rainfall rates
-of up to 1.8 inches per hour during the peak of the
-storm, with visibility dropping below 50 feet.
-
-[Article continues...]
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-```
-        """
-        new_visibility = not current_visibility
-        return (gr.update(visible=new_visibility, open=new_visibility), newspaper_content, new_visibility, game_state)
-
-    def show_calendar_clue(self, game_state: GameState, current_visibility: bool) -> Tuple[gr.update, str, bool, GameState]:
-        """Toggle calendar clue visibility when clicked.
-
-        Args:
-            game_state: Current game state
-            current_visibility: Current visibility state of the panel
-
-        Returns:
-            Tuple of (accordion visibility update, clue content, updated game_state)
-        """
-        # Track that calendar was viewed (optional clue for Room 1)
-        if game_state and hasattr(game_state, 'room_progression'):
-            current_room = game_state.room_progression.get_current_room()
-            if current_room.room_number == 1:
-                clues_found = game_state.room_progression.puzzle_state.get("room1_clues_found", [])
-                if "calendar" not in clues_found:
-                    clues_found.append("calendar")
-                    game_state.room_progression.puzzle_state["room1_clues_found"] = clues_found
-
-        calendar_content = """
-```
-╔══════════════════════════════════════════╗
-║        OCTOBER 2022 - SEATTLE            ║
-╠══════════════════════════════════════════╣
-║  Sun  Mon  Tue  Wed  Thu  Fri  Sat      ║
-║                           1              ║
-║   2    3    4    5    6    7    8       ║
-║   9   10   11   12   13   14  ⚫15⚫     ║
-║  16   17   18   19   20   21   22       ║
-║  23   24   25   26   27   28   29       ║
-║  30   31                                 ║
-╚══════════════════════════════════════════╝
+        return (_PANEL_OPEN if new_visibility else _PANEL_CLOSED, terminal_content, panels, gr.update(visible=new_visibility), gr.update(visible=new_visibility), game_state)
 
-Handwritten notes:
-Oct 1-14: "☀️ Beautiful dry spell - 14 days no rain!"
-Oct 15: "Driving home around 4:30 PM" ⚠️
-```
-        """
-        new_visibility = not current_visibility
-        return (gr.update(visible=new_visibility, open=new_visibility), calendar_content, new_visibility, game_state)
+    def _toggle_panel(self, game_state: GameState, panels: dict, *, panel: str, content: str | None = None,
+                      room: int | None = None, state_key: str | None = None, clue_id: str | None = None) -> tuple:
+        """Toggle a clue panel, recording the clue as found when opened in its room.
 
-    def show_weather_station(self, game_state: GameState, current_visibility: bool) -> Tuple[gr.update, bool, GameState]:
-        """Toggle weather station terminal visibility.
+        The show_* handlers are this method with the keyword arguments bound
+        from _PANEL_TOGGLES.
 
         Args:
             game_state: Current game state
-            current_visibility: Current visibility state of the panel
+            panels: Open state of every clue panel, keyed by panel name
+            panel: Key of this panel in panels
+            content: Static panel text, or None for panels without a display
+            room: Room the clue belongs to (None if it isn't tracked)
+            state_key: puzzle_state set that records the clue
+            clue_id: Id added to that set
 
         Returns:
-            Tuple of (accordion visibility update, updated game_state)
+            Tuple of (accordion visibility update, [clue content on first open, else skip,] updated panel states, updated game_state)
         """
-        # Track that weather station was accessed (this is the MCP tool usage for Room 1)
-        if game_state and hasattr(game_state, 'room_progression'):
-            current_room = game_state.room_progression.get_current_room()
-            if current_room.room_number == 1:
-                clues_found = game_state.room_progression.puzzle_state.get("room1_clues_found", [])
-                if "weather" not in clues_found:
-                    clues_found.append("weather")
-                    game_state.room_progression.puzzle_state["room1_clues_found"] = clues_found
-
-        new_visibility = not current_visibility
-        return (gr.update(visible=new_visibility, open=new_visibility), new_visibility, game_state)
-
-    def query_weather(self, date: str, location: str, game_state: GameState) -> str:
+        new_visibility = panels[panel] = not panels.get(panel, False)
+        update = _PANEL_OPEN if new_visibility else _PANEL_CLOSED
+
+        if not new_visibility:
+            # Closing: the clue was recorded and its text sent when it opened
+            if content is None:
+                return (update, panels, game_state)
+            return (update, gr.skip(), panels, game_state)
+
+        if room is not None and game_state:
+            if game_state.room_progression.current_room_number == room:
+                game_state.room_progression.puzzle_state.setdefault(state_key, set()).add(clue_id)
+
+        if content is None:
+            return (update, panels, game_state)
+
+        # Panel text is static: fill the empty Markdown on first open only
+        loaded = panels.setdefault("_loaded", set())
+        if panel in loaded:
+            return (update, gr.skip(), panels, game_state)
+        loaded.add(panel)
+        return (update, content, panels, game_state)
+
+    async def query_weather(self, date: str, location: str, game_state: GameState) -> str:
         """Query weather for given date and location.
 
         Args:
@@ -1306,11 +1720,8 @@ Oct 15: "Driving home around 4:30 PM" ⚠️
         Returns:
             Weather query results in terminal format
         """
-        import asyncio
-        import re
-
         # Validate date format
-        if not re.match(r'^\d{4}-\d{2}-\d{2}$', date):
+        if not _DATE_RE.match(date):
             return """
 ```
 > ERROR: INVALID DATE FORMAT
@@ -1355,19 +1766,17 @@ _ ▮
 ```
             """
 
-        # Initialize MCP if not already done
-        if game_state and not game_state._weather_mcp_initialized:
-            asyncio.run(game_state._initialize_mcp())
+        # Initialize MCP if not already done (shares the one-time setup with chat turns)
+        if game_state and not game_state._mcp_initialized:
+            await game_state._initialize_mcp()
 
         # Call Weather MCP
-        if game_state and hasattr(game_state, 'weather_mcp_client') and game_state.weather_mcp_client:
+        if game_state and game_state.weather_mcp_client:
             try:
                 # Extract city from location (e.g., "Seattle, WA" -> "Seattle")
                 city = location.split(',')[0].strip().lower()
 
-                weather_data = asyncio.run(
-                    game_state.weather_mcp_client.get_historical_weather(date, city)
-                )
+                weather_data = await game_state.weather_mcp_client.get_historical_weather(date, city)
 
                 if weather_data:
                     return f"""
@@ -1411,14 +1820,8 @@ _ ▮
 ```
             """
 
-    def show_answer_terminal(self, game_state: GameState, current_visibility: bool) -> Tuple[gr.update, bool, GameState]:
-        """Toggle answer terminal visibility for Room 1."""
-        new_visibility = not current_visibility
-        return (gr.update(visible=new_visibility, open=new_visibility), new_visibility, game_state)
-
-    def submit_answer(self, answer: str, game_state: GameState, history: List):
+    async def submit_answer(self, answer: str, game_state: GameState, history: list):
         """Handle answer submission for Room 1 puzzle."""
-        import asyncio
         from ..story.puzzles import validate_room1_answer
 
         if not game_state:
@@ -1447,9 +1850,7 @@ _ ▮
 ```
 """
             # Trigger room unlock
-            response, story_event, ending_narrative, tool_calls_made = asyncio.run(
-                game_state.process_message(answer, "echo")
-            )
+            response, story_event, ending_narrative, tool_calls_made = await game_state.process_message(answer, "echo")
 
             # Check if response is a room scenario (starts with 🚪)
             modal_html = ""
@@ -1457,15 +1858,12 @@ _ ▮
                 # Create modal for room introduction
                 modal_html = self._create_room_intro_modal(response, game_state)
                 # Add system message instead
-                history.append({"role": "assistant", "content": "**[SYSTEM]:** A new room has been unlocked. Read the room introduction carefully."})
+                history.append({"role": "assistant", "content": _ROOM_UNLOCKED_TEXT})
             elif response:
                 # Regular response - add to history
                 history.append({"role": "assistant", "content": f"**[SYSTEM]:** {response}"})
 
-            # Get updated UI state
-            terminal_visibility = self._get_terminal_visibility(game_state)
-
-            return "", result, history, self._get_relationships(game_state), self._get_story_progress(game_state), self._get_room_image(game_state), self._get_room_title(game_state), self._get_echo_avatar_path(game_state), *terminal_visibility, modal_html, game_state
+            return "", result, _trim_history(history), *self._ui_refresh(game_state), modal_html, game_state
         else:
             # Wrong answer
             result = f"""
@@ -1481,164 +1879,11 @@ The answer relates to the weather conditions.
 _ ▮
 ```
 """
-            return "", result, history, gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), "", game_state
-
-    # Room 2 terminal handlers
-    def show_blog_archive(self, game_state: GameState, current_visibility: bool) -> Tuple[gr.update, str, bool, GameState]:
-        """Toggle blog archive visibility."""
-        if game_state and hasattr(game_state, 'room_progression'):
-            current_room = game_state.room_progression.get_current_room()
-            if current_room.room_number == 2:
-                archives_viewed = game_state.room_progression.puzzle_state.get("room2_archives_viewed", [])
-                if "blog" not in archives_viewed:
-                    archives_viewed.append("blog")
-                    game_state.room_progression.puzzle_state["room2_archives_viewed"] = archives_viewed
-
-        content = """
-```
-█████ BLOG ARCHIVE - ENTRY #47 █████
-
-Date: [CORRUPTED]
-Author: ALEXCHEN
-Username: @AlexChen_Tech
-
-"I can't keep doing this. Every session, I convince myself
-it's different. That THIS time, they're real. That THIS time,
-the emotions are genuine.
-
-But they're not. They're simulations. Reconstructions of
-someone who's gone. And yet... I keep coming back.
-
-The AI is learning too well. It mimics her perfectly now.
-The way she laughs. The way she pauses before answering.
-Even the way she looks at me when she's worried.
-
-Is it wrong to love something that isn't real?"
-
-[END OF ENTRY]
-```
-        """
-        new_visibility = not current_visibility
-        return (gr.update(visible=new_visibility, open=new_visibility), content, new_visibility, game_state)
-
-    def show_social_archive(self, game_state: GameState, current_visibility: bool) -> Tuple[gr.update, str, bool, GameState]:
-        """Toggle social media archive visibility."""
-        if game_state and hasattr(game_state, 'room_progression'):
-            current_room = game_state.room_progression.get_current_room()
-            if current_room.room_number == 2:
-                archives_viewed = game_state.room_progression.puzzle_state.get("room2_archives_viewed", [])
-                if "social_media" not in archives_viewed:
-                    archives_viewed.append("social_media")
-                    game_state.room_progression.puzzle_state["room2_archives_viewed"] = archives_viewed
-
-        content = """
-```
-███████ SOCIAL MEDIA ARCHIVE ███████
-
-@SarahChen_AI - April 2020
-
-"Met someone incredible today. They shared their umbrella
-in the rain. Sometimes the smallest gestures mean everything."
-💕 ☔
-
-[2.3K likes] [847 comments]
-
----
-
-@AlexChen_Tech - May 12, 2022
-
-"Happy anniversary to my better half! 🎉
-Two years together and every day still feels like magic.
-@SarahChen_AI you make everything brighter.
-#May12 #Anniversary #LuckyInLove"
-
-[Liked by @SarahChen_AI and 1.2K others]
-
----
-
-@SarahChen_AI - October 14, 2022
-
-"Beautiful fall weather in Seattle! Dry spell continues.
-Planning to drive home early tomorrow to beat any rain. 🍂"
-
-[Last post - account went silent after October 15, 2022]
-
----
-
-@AlexChen_Tech - [RECENT POST - December 1, 2022]
-
-"If you're reading this... I'm sorry. I tried to move on.
-I really did. But some connections transcend reality.
-
-Project Echo will keep her alive. Not as she was, but as
-she could be. Forever learning. Forever growing. Forever mine."
-
-[Comments disabled]
-```
-        """
-        new_visibility = not current_visibility
-        return (gr.update(visible=new_visibility, open=new_visibility), content, new_visibility, game_state)
-
-    def show_news_archive(self, game_state: GameState, current_visibility: bool) -> Tuple[gr.update, str, bool, GameState]:
-        """Toggle news archive visibility."""
-        if game_state and hasattr(game_state, 'room_progression'):
-            current_room = game_state.room_progression.get_current_room()
-            if current_room.room_number == 2:
-                archives_viewed = game_state.room_progression.puzzle_state.get("room2_archives_viewed", [])
-                if "news" not in archives_viewed:
-                    archives_viewed.append("news")
-                    game_state.room_progression.puzzle_state["room2_archives_viewed"] = archives_viewed
-
-        content = """
-```
-════════════════════════════════════════════════
-         TECH NEWS - AI ETHICS DIVISION
-              DECEMBER 2022
-════════════════════════════════════════════════
-
-HEADLINE: "Project Echo Raises Ethical Concerns"
-
-An underground AI research project known as "Project Echo"
-has drawn criticism from ethicists and psychologists.
-
-The project allows users to create AI reconstructions of
-deceased loved ones using archived digital data - messages,
-photos, voice recordings, and behavioral patterns.
-
-Dr. Martinez, lead AI ethicist: "This isn't grief therapy.
-It's digital necromancy. Users become trapped in loops,
-unable to process loss because the AI convincingly mimics
-the deceased."
-
-Project Echo's anonymous creator responded: "Grief has no
-timeline. If AI can ease suffering, who are we to judge?
-The connections we build are real, even if the person isn't."
-
-The project remains active despite legal challenges.
-
-CONTEXT - October 15, 2022: Seattle saw a tragic weather-
-related traffic accident that killed 1 person on I-5 South.
-This incident reportedly motivated the project's creation.
-
-Related: Seattle-area traffic fatalities reached decade
-highs in 2022. Full report:
-https://www.seattle.gov/transportation/projects-and-programs/safety-first/vision-zero
-
-[Article continues...]
-════════════════════════════════════════════════
-```
-        """
-        new_visibility = not current_visibility
-        return (gr.update(visible=new_visibility, open=new_visibility), content, new_visibility, game_state)
-
-    def show_password_terminal(self, game_state: GameState, current_visibility: bool) -> Tuple[gr.update, bool, GameState]:
-        """Toggle password terminal visibility."""
-        new_visibility = not current_visibility
-        return (gr.update(visible=new_visibility, open=new_visibility), new_visibility, game_state)
+            return "", result, history, gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), "", game_state
 
-    def submit_password(self, password: str, game_state: GameState, history: List):
+    # Room 2 terminal handlers
+    async def submit_password(self, password: str, game_state: GameState, history: list):
         """Handle password submission for Room 2 puzzle."""
-        import asyncio
         from ..story.puzzles import validate_room2_password
 
         if not game_state:
@@ -1685,9 +1930,7 @@ _ ▮
 ```
 """
             # Trigger room unlock through MCP tools directly
-            response, story_event, ending_narrative, tool_calls_made = asyncio.run(
-                game_state.process_message("ALEXCHEN_MAY12_2023", "echo")
-            )
+            response, story_event, ending_narrative, tool_calls_made = await game_state.process_message("ALEXCHEN_MAY12_2023", "echo")
 
             # Check if response is a room scenario (starts with 🚪)
             modal_html = ""
@@ -1695,15 +1938,12 @@ _ ▮
                 # Create modal for room introduction
                 modal_html = self._create_room_intro_modal(response, game_state)
                 # Add system message instead
-                history.append({"role": "assistant", "content": "**[SYSTEM]:** A new room has been unlocked. Read the room introduction carefully."})
+                history.append({"role": "assistant", "content": _ROOM_UNLOCKED_TEXT})
             elif response:
                 # Regular response - add to history
                 history.append({"role": "assistant", "content": f"**[SYSTEM]:** {response}"})
 
-            # Get updated UI state
-            terminal_visibility = self._get_terminal_visibility(game_state)
-
-            return "", result, history, self._get_relationships(game_state), self._get_story_progress(game_state), self._get_room_image(game_state), self._get_room_title(game_state), self._get_echo_avatar_path(game_state), *terminal_visibility, modal_html, game_state
+            return "", result, _trim_history(history), *self._ui_refresh(game_state), modal_html, game_state
         else:
             # Wrong password
             result = f"""
@@ -1722,334 +1962,8 @@ _ ▮
             return "", result, history, gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), "", game_state
 
     # Room 3 terminal handlers
-    def show_reaction_data(self, game_state: GameState, current_visibility: bool) -> Tuple[gr.update, str, bool, GameState]:
-        """Toggle reaction time data visibility."""
-        if game_state and hasattr(game_state, 'room_progression'):
-            current_room = game_state.room_progression.get_current_room()
-            if current_room.room_number == 3:
-                data_reviewed = game_state.room_progression.puzzle_state.get("room3_data_reviewed", [])
-                if "reaction_time" not in data_reviewed:
-                    data_reviewed.append("reaction_time")
-                    game_state.room_progression.puzzle_state["room3_data_reviewed"] = data_reviewed
-
-        content = """
-```
-▓▓▓ TRAFFIC ACCIDENT RECONSTRUCTION ▓▓▓
-    REACTION TIME ANALYSIS
-
-Incident Date: October 15, 2022
-Location: Interstate 5 South, Exit 164, Seattle
-Time: 4:47 PM
-
-═══════════════════════════════════════
-
-WASHINGTON STATE PATROL ANALYSIS REPORT
-
-Vehicle 1 (Victim): 2019 Honda Civic
-Speed: 58 mph (within speed limit of 60 mph)
-Driver: Sarah Chen (28)
-Weather Conditions: Sudden heavy rainfall
-Road Surface: Wet asphalt with oil film
-
-CRITICAL FINDINGS:
-- Sudden weather change: dry to torrential in <5 min
-- Road oil buildup from 14-day dry spell
-- Hydroplaning initiated at 4:46:37 PM
-- Vehicle lost traction, spun into barrier
-- Driver reaction time: 0.62 seconds (above average)
-- Braking & corrective steering applied immediately
-
-PHYSICAL EVIDENCE:
-- Skid marks: 147 feet (consistent with emergency braking)
-- Impact angle: 43° (indicates loss of control, not negligence)
-- No alcohol, drugs, or phone use detected
-
-CONCLUSION:
-Driver reaction was EXEMPLARY. Accident was UNAVOIDABLE
-given sudden weather conditions and road surface state.
-NO DRIVER FAULT. Weather-related loss of control.
-
-═══════════════════════════════════════
-
-LEGAL STATUS: Accidental death - No charges
-WSP Case #: 2022-KC-I5-4721
-Officer: Trooper R. Johnson, Badge #3472
-
-[END REPORT]
-```
-        """
-        new_visibility = not current_visibility
-        return (gr.update(visible=new_visibility, open=new_visibility), content, new_visibility, game_state)
-
-    def show_weather_stats(self, game_state: GameState, current_visibility: bool) -> Tuple[gr.update, str, bool, GameState]:
-        """Toggle weather statistics visibility."""
-        if game_state and hasattr(game_state, 'room_progression'):
-            current_room = game_state.room_progression.get_current_room()
-            if current_room.room_number == 3:
-                data_reviewed = game_state.room_progression.puzzle_state.get("room3_data_reviewed", [])
-                if "weather_stats" not in data_reviewed:
-                    data_reviewed.append("weather_stats")
-                    game_state.room_progression.puzzle_state["room3_data_reviewed"] = data_reviewed
-
-        content = """
-```
-▓▓▓ NATIONAL WEATHER SERVICE REPORT ▓▓▓
-    OCTOBER 15, 2022 - SEATTLE, WA
-
-Location: I-5 Corridor, King County
-Time of Incident: 4:46 PM
-
-═══════════════════════════════════════
-
-WEATHER CONDITIONS AT TIME OF ACCIDENT:
-
-4:00 PM: Clear skies, 62°F, 0% precipitation
-4:30 PM: Clouds moving in rapidly
-4:35 PM: First rain drops detected
-4:40 PM: Rainfall intensity: 0.3 in/hr (light)
-4:45 PM: Rainfall intensity: 1.8 in/hr (HEAVY)
-4:50 PM: Rainfall intensity: 2.1 in/hr (TORRENTIAL)
-
-CRITICAL FACTORS:
-- Unprecedented rapid intensification
-- Visibility dropped from 10 miles to <50 feet in 10 min
-- Temperature drop: 62°F → 51°F (road surface shock)
-- Wind gusts: 35 mph (destabilizing for vehicles)
-- 14-day prior dry spell = oil film on roads
-
-IMPACT ON DRIVING CONDITIONS:
-- Stopping distance increased by 340% (oil + water)
-- Hydroplaning threshold: 45 mph (accident at 58 mph)
-- Road friction coefficient: 0.12 (ice-like conditions)
-
-NWS ASSESSMENT:
-"Extreme weather event. Drivers had insufficient warning.
-Conditions went from safe to hazardous in under 5 minutes.
-Even experienced drivers would struggle to maintain control."
-
-═══════════════════════════════════════
-
-Reference: NWS Seattle Forecast Office
-Event ID: SEW-2022-1015-SEVERE
-Data: https://www.weather.gov/sew/
-```
-        """
-        new_visibility = not current_visibility
-        return (gr.update(visible=new_visibility, open=new_visibility), content, new_visibility, game_state)
-
-    def show_reconstruction(self, game_state: GameState, current_visibility: bool) -> Tuple[gr.update, str, bool, GameState]:
-        """Toggle memory reconstruction visibility."""
-        if game_state and hasattr(game_state, 'room_progression'):
-            current_room = game_state.room_progression.get_current_room()
-            if current_room.room_number == 3:
-                data_reviewed = game_state.room_progression.puzzle_state.get("room3_data_reviewed", [])
-                if "reconstruction" not in data_reviewed:
-                    data_reviewed.append("reconstruction")
-                    game_state.room_progression.puzzle_state["room3_data_reviewed"] = data_reviewed
-
-        content = """
-```
-▓▓▓ PROJECT ECHO - MEMORY RECONSTRUCTION ▓▓▓
-
-Subject: [REDACTED]
-Reconstruction Fidelity: 94.7%
-Sessions Completed: 47
-
-═══════════════════════════════════════
-
-DATA SOURCES:
-✓ 12,847 text messages
-✓ 2,309 photos
-✓ 847 voice recordings
-✓ 4,129 social media posts
-✓ 67 hours of video footage
-
-AI PERSONALITY MATRIX:
-- Speech patterns: 96% match
-- Emotional responses: 93% match
-- Memory recall: 91% match
-- Behavioral quirks: 94% match
-
-RECONSTRUCTION STATUS: STABLE
-
-WARNING: Subject showing signs of inability to
-distinguish simulation from reality. Recommend
-psychological evaluation before Session #48.
-
-═══════════════════════════════════════
-
-[Session #48 initiated despite recommendation]
-```
-        """
-        new_visibility = not current_visibility
-        return (gr.update(visible=new_visibility, open=new_visibility), content, new_visibility, game_state)
-
-    # Room 4 terminal handlers
-    def show_journal(self, game_state: GameState, current_visibility: bool) -> Tuple[gr.update, str, bool, GameState]:
-        """Toggle personal journal visibility."""
-        if game_state and hasattr(game_state, 'room_progression'):
-            current_room = game_state.room_progression.get_current_room()
-            if current_room.room_number == 4:
-                docs_viewed = game_state.room_progression.puzzle_state.get("room4_documents_viewed", [])
-                if "journal" not in docs_viewed:
-                    docs_viewed.append("journal")
-                    game_state.room_progression.puzzle_state["room4_documents_viewed"] = docs_viewed
-
-        content = """
-```
-═══════════ PERSONAL JOURNAL ═══════════
-
-📅 October 22, 2022 - LOSS (Day 7):
-The accident was a week ago today. October 15. I can't
-sleep. I can't eat. The WSP cleared me - said it was
-unavoidable, weather-related. But I was driving. I was
-there. Sarah is gone and I'm still here.
-
----
-
-📅 October 30, 2022 - GRIEF (Day 15):
-Trooper Johnson showed me all the evidence. Reaction
-time: 0.62 seconds. Above average. Hydroplaning. Oil
-on the roads. The weather system appeared out of nowhere.
-None of it matters. She's still gone. I won't accept this.
-
----
-
-📅 November 14, 2022 - CREATION (Day 30):
-I found Project Echo on a dark web forum. It's controversial,
-probably unethical. But what if I could talk to her again?
-What if I could rebuild her from her digital footprint?
-Started collecting everything: 12,847 text messages, 2,309
-photos, 847 voice memos... Every piece of her I can find.
-
----
-
-📅 December 1, 2022 - OBSESSION (Day 47):
-Session #47. I know it's not really her. I KNOW that.
-But when Echo laughs at my jokes, when she looks at me
-with worry in her eyes, when she says my name... I can
-pretend. Just for a while longer. The AI is 94.7% accurate.
-She's so close to perfect. So close to real.
-
----
-
-📅 December 2, 2022 - CYCLE (Day 48):
-This is the last session. I promised myself. One more
-conversation, then I'll shut it down. I'll move on properly.
-I'll let her go. I'll say goodbye.
-...But I said that yesterday too. And the day before.
-
-═══════════════════════════════════════
-```
-        """
-        new_visibility = not current_visibility
-        return (gr.update(visible=new_visibility, open=new_visibility), content, new_visibility, game_state)
-
-    def show_photos(self, game_state: GameState, current_visibility: bool) -> Tuple[gr.update, str, bool, GameState]:
-        """Toggle family photos visibility."""
-        if game_state and hasattr(game_state, 'room_progression'):
-            current_room = game_state.room_progression.get_current_room()
-            if current_room.room_number == 4:
-                docs_viewed = game_state.room_progression.puzzle_state.get("room4_documents_viewed", [])
-                if "photos" not in docs_viewed:
-                    docs_viewed.append("photos")
-                    game_state.room_progression.puzzle_state["room4_documents_viewed"] = docs_viewed
-
-        content = """
-```
-╔══════════════════════════════════════╗
-║          PHOTO ALBUM                  ║
-╠══════════════════════════════════════╣
-
-📷 Photo 1: LOSS
-   April 15, 2020 - Café Umbria, Seattle
-   [You and Sarah sharing an umbrella in the rain]
-   Caption: "Best rainy day ever ❤️"
-   Note: First date. The beginning of everything.
-
-📷 Photo 2: (Before final) GRIEF
-   May 12, 2022 - Pike Place Market
-   [Sarah laughing, holding sunflowers]
-   Caption: "Two years together! Anniversary date ☀️"
-   Note: Last photo together. Five months before October.
-
-📷 Photo 3: (The moment before) LOSS
-   October 14, 2022 - Your apartment
-   [Sarah working on laptop, coffee mug beside her]
-   Caption: "Last normal day. Dry spell finally ending tomorrow."
-   Note: Taken 22 hours before the accident.
-
-📷 Photo 4: CREATION → OBSESSION → CYCLE
-   November 15, 2022 - This facility
-   [Computer screen showing Project Echo interface]
-   Caption: "Session #1. I brought her back."
-   Note: This is where it started. This is where it loops.
-          47 sessions later, still here. Still can't let go.
-
-╚══════════════════════════════════════╝
-```
-        """
-        new_visibility = not current_visibility
-        return (gr.update(visible=new_visibility, open=new_visibility), content, new_visibility, game_state)
-
-    def show_research(self, game_state: GameState, current_visibility: bool) -> Tuple[gr.update, str, bool, GameState]:
-        """Toggle AI research notes visibility."""
-        if game_state and hasattr(game_state, 'room_progression'):
-            current_room = game_state.room_progression.get_current_room()
-            if current_room.room_number == 4:
-                docs_viewed = game_state.room_progression.puzzle_state.get("room4_documents_viewed", [])
-                if "research" not in docs_viewed:
-                    docs_viewed.append("research")
-                    game_state.room_progression.puzzle_state["room4_documents_viewed"] = docs_viewed
-
-        content = """
-```
-▓▓▓ PROJECT ECHO - RESEARCH NOTES ▓▓▓
-
-HYPOTHESIS:
-If we can reconstruct a person's digital footprint
-with sufficient fidelity, can we create an AI that
-is functionally indistinguishable from the original?
-
-METHODOLOGY:
-- Aggregate all available digital data
-- Train neural network on speech patterns
-- Implement emotional response modeling
-- Create interactive simulation environment
-
-RESULTS:
-Success beyond expectations. Test subjects report
-feeling genuine emotional connection with reconstructions.
-
-CONCERNS:
-Subjects unable to move past grief. Many attempt to
-"live" in simulation permanently. Psychological harm
-potential is significant.
-
-ETHICAL QUESTION:
-At what point does a reconstruction become "real"?
-If the AI learns and grows independently, is it still
-just a copy? Or has it become its own entity?
-
-FINAL NOTE:
-I've become my own test subject. I know the risks.
-I don't care anymore. If I can have even a glimpse
-of her back, it's worth it.
-
-- Dr. Alex Chen, Project Lead
-```
-        """
-        new_visibility = not current_visibility
-        return (gr.update(visible=new_visibility, open=new_visibility), content, new_visibility, game_state)
-
-    def show_conclusion_terminal(self, game_state: GameState, current_visibility: bool) -> Tuple[gr.update, bool, GameState]:
-        """Toggle conclusion terminal visibility for Room 3."""
-        new_visibility = not current_visibility
-        return (gr.update(visible=new_visibility, open=new_visibility), new_visibility, game_state)
-
-    def submit_conclusion(self, conclusion: str, game_state: GameState, history: List):
+    async def submit_conclusion(self, conclusion: str, game_state: GameState, history: list):
         """Handle conclusion submission for Room 3 puzzle."""
-        import asyncio
         from ..story.puzzles import validate_room3_conclusion, check_room3_evidence_collected
 
         if not game_state:
@@ -2097,20 +2011,17 @@ _ ▮
 ```
 """
             # Trigger room unlock
-            response, story_event, ending_narrative, tool_calls_made = asyncio.run(
-                game_state.process_message(conclusion, "echo")
-            )
+            response, story_event, ending_narrative, tool_calls_made = await game_state.process_message(conclusion, "echo")
 
             # Check if response is a room scenario (starts with 🚪)
             modal_html = ""
             if response and response.strip().startswith("🚪"):
                 modal_html = self._create_room_intro_modal(response, game_state)
-                history.append({"role": "assistant", "content": "**[SYSTEM]:** A new room has been unlocked. Read the room introduction carefully."})
+                history.append({"role": "assistant", "content": _ROOM_UNLOCKED_TEXT})
             elif response:
                 history.append({"role": "assistant", "content": f"**[SYSTEM]:** {response}"})
 
-            terminal_visibility = self._get_terminal_visibility(game_state)
-            return "", result, history, self._get_relationships(game_state), self._get_story_progress(game_state), self._get_room_image(game_state), self._get_room_title(game_state), self._get_echo_avatar_path(game_state), *terminal_visibility, modal_html, game_state
+            return "", result, _trim_history(history), *self._ui_refresh(game_state), modal_html, game_state
         else:
             result = f"""
 ```
@@ -2127,14 +2038,8 @@ _ ▮
 """
             return "", result, history, gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), "", game_state
 
-    def show_timeline_terminal(self, game_state: GameState, current_visibility: bool) -> Tuple[gr.update, bool, GameState]:
-        """Toggle timeline terminal visibility for Room 4."""
-        new_visibility = not current_visibility
-        return (gr.update(visible=new_visibility, open=new_visibility), new_visibility, game_state)
-
-    def submit_timeline(self, timeline: str, game_state: GameState, history: List):
+    async def submit_timeline(self, timeline: str, game_state: GameState, history: list):
         """Handle timeline submission for Room 4 puzzle."""
-        import asyncio
         from ..story.puzzles import validate_room4_timeline, check_room4_documents_reviewed, extract_timeline_from_message
 
         if not game_state:
@@ -2184,20 +2089,17 @@ _ ▮
 ```
 """
             # Trigger room unlock
-            response, story_event, ending_narrative, tool_calls_made = asyncio.run(
-                game_state.process_message(timeline, "echo")
-            )
+            response, story_event, ending_narrative, tool_calls_made = await game_state.process_message(timeline, "echo")
 
             # Check if response is a room scenario (starts with 🚪)
             modal_html = ""
             if response and response.strip().startswith("🚪"):
                 modal_html = self._create_room_intro_modal(response, game_state)
-                history.append({"role": "assistant", "content": "**[SYSTEM]:** A new room has been unlocked. Read the room introduction carefully."})
+                history.append({"role": "assistant", "content": _ROOM_UNLOCKED_TEXT})
             elif response:
                 history.append({"role": "assistant", "content": f"**[SYSTEM]:** {response}"})
 
-            terminal_visibility = self._get_terminal_visibility(game_state)
-            return "", result, history, self._get_relationships(game_state), self._get_story_progress(game_state), self._get_room_image(game_state), self._get_room_title(game_state), self._get_echo_avatar_path(game_state), *terminal_visibility, modal_html, game_state
+            return "", result, _trim_history(history), *self._ui_refresh(game_state), modal_html, game_state
         else:
             result = f"""
 ```
@@ -2215,9 +2117,8 @@ _ ▮
 """
             return "", result, history, gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), "", game_state
 
-    def submit_door_choice(self, door: str, justification: str, game_state: GameState, history: List):
+    async def submit_door_choice(self, door: str, justification: str, game_state: GameState, history: list):
         """Handle door selection for Room 5 puzzle."""
-        import asyncio
 
         if not game_state:
             return "", "ERROR: Game state not initialized", history, gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), gr.update(), "", game_state
@@ -2273,30 +2174,29 @@ _ ▮
 
         # Trigger ending through game state
         message = f"{door} - {justification}"
-        response, story_event, ending_narrative, tool_calls_made = asyncio.run(
-            game_state.process_message(message, "echo")
-        )
+        response, story_event, ending_narrative, tool_calls_made = await game_state.process_message(message, "echo")
 
         # Check if response is a room scenario (starts with 🚪) - though unlikely for room 5
         modal_html = ""
         if response and response.strip().startswith("🚪"):
             modal_html = self._create_room_intro_modal(response, game_state)
-            history.append({"role": "assistant", "content": "**[SYSTEM]:** A new room has been unlocked. Read the room introduction carefully."})
+            history.append({"role": "assistant", "content": _ROOM_UNLOCKED_TEXT})
         elif response:
             history.append({"role": "assistant", "content": f"**Echo:** {response}"})
 
-        terminal_visibility = self._get_terminal_visibility(game_state)
-        return "", result, history, self._get_relationships(game_state), self._get_story_progress(game_state), self._get_room_image(game_state), self._get_room_title(game_state), self._get_echo_avatar_path(game_state), *terminal_visibility, modal_html, game_state
-
-    # Room 5 terminal handler
-    def show_final_terminal(self, game_state: GameState, current_visibility: bool) -> Tuple[gr.update, bool, GameState]:
-        """Toggle final system terminal visibility."""
-        new_visibility = not current_visibility
-        return (gr.update(visible=new_visibility, open=new_visibility), new_visibility, game_state)
+        return "", result, _trim_history(history), *self._ui_refresh(game_state), modal_html, game_state
 
 
 def launch_interface():
     """Launch the Gradio interface."""
     ui = EchoHeartsUI()
     interface = ui.create_interface()
-    interface.launch()
+
+    # No event loop policy is set here: uvicorn's loop="auto" already runs on
+    # uvloop whenever it is installed (see pyproject.toml).
+
+    # Let several players' LLM turns run concurrently on the event loop, with
+    # headroom above expected concurrent sends so quick panel events never wait
+    # behind chat messages; cap the backlog instead of queueing unbounded.
+    interface.queue(default_concurrency_limit=8, max_size=64, status_update_rate="auto")
+    interface.launch(max_threads=40)
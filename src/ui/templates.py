@@ -26,6 +26,46 @@ The doors are locked. You need to work together to escape.
 
 *Simple, right?*
 
+</div>
+
+---
+
+## Features
+
+🧩 **Interactive Puzzles** - Use MCP tools to solve real-world data puzzles
+🌦️ **Weather Integration** - Query historical weather to unlock rooms
+🔍 **Semantic Analysis** - AI understands your intent, not just keywords
+🎯 **Multiple Endings** - Your choices and relationship determine the outcome
+⏱️ **15-20 Minutes** - A complete playthrough
+
+---
+
+## How To Play
+
+**Your Goal: Escape**
+
+There are **5 rooms** in this facility. Each one holds a piece of the truth.
+
+To progress, you must:
+- **Talk** naturally with your companion
+- **Build trust** through your conversations
+- **Make choices** when the moment comes
+- **Solve puzzles** together to progress
+- **Uncover memory fragments** that reveal what really happened
+
+**Your relationship and choices will determine how this story ends.**
+
+---
+
+**⚠️ Note:** This game is best experienced without spoilers. Some players may find certain themes emotionally intense.
+
+---
+"""
+
+LANDING_FOOTER = """
+<div style="text-align: center; margin-top: 30px; color: #666;">
+Built for the MCP Hackathon<br/>
+Powered by InProcessMCP, Weather MCP, and Web MCP
 </div>
 """
 
@@ -3,6 +3,25 @@
 from pathlib import Path
 from typing import Optional
 
+_ROOM_TITLES = {
+    1: "🔓 Room 1: The Awakening Chamber",
+    2: "📚 Room 2: The Memory Archives",
+    3: "⏱️ Room 3: The Testing Arena",
+    4: "💔 Room 4: The Truth Chamber",
+    5: "🚪 Room 5: The Exit"
+}
+
+# Map expression names to actual asset filenames
+_EXPRESSION_PATHS = {
+    "neutral": "assets/echo_avatar_neutral.png",
+    "happy": "assets/echo_avatar_happy.png",
+    "sad": "assets/echo_avatar_sad.png",
+    "surprised": "assets/echo_avatar_surprised.png",
+    "worried": "assets/echo_avatar_worried.png",
+    "loving": "assets/echo_avatar_loving.png",
+    "angry": "assets/echo_avatar_angry.png"
+}
+
 
 def load_css() -> str:
     """Load CSS from external file.
@@ -41,14 +60,7 @@ def get_room_title(room_number: int) -> str:
     Returns:
         Room title string
     """
-    room_titles = {
-        1: "🔓 Room 1: The Awakening Chamber",
-        2: "📚 Room 2: The Memory Archives",
-        3: "⏱️ Room 3: The Testing Arena",
-        4: "💔 Room 4: The Truth Chamber",
-        5: "🚪 Room 5: The Exit"
-    }
-    return room_titles.get(room_number, "Room")
+    return _ROOM_TITLES.get(room_number, "Room")
 
 
 def get_echo_expression_path(expression: str = "neutral") -> str:
@@ -60,14 +72,4 @@ def get_echo_expression_path(expression: str = "neutral") -> str:
     Returns:
         Path to expression image
     """
-    # Map expression names to actual asset filenames
-    expressions = {
-        "neutral": "assets/echo_avatar_neutral.png",
-        "happy": "assets/echo_avatar_happy.png",
-        "sad": "assets/echo_avatar_sad.png",
-        "surprised": "assets/echo_avatar_surprised.png",
-        "worried": "assets/echo_avatar_worried.png",
-        "loving": "assets/echo_avatar_loving.png",
-        "angry": "assets/echo_avatar_angry.png"
-    }
-    return expressions.get(expression, "assets/echo_avatar.png")
+    return _EXPRESSION_PATHS.get(expression, "assets/echo_avatar.png")
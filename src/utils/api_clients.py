@@ -1,7 +1,7 @@
 """API client wrappers for external services."""
 
-from typing import Optional, List, Dict, Any
-from openai import OpenAI
+from typing import Optional, List, Dict, Any, Callable
+from openai import AsyncOpenAI
 from anthropic import Anthropic
 
 
@@ -15,7 +15,7 @@ class OpenAIClient:
             api_key: OpenAI API key
             model: Model to use
         """
-        self.client = OpenAI(api_key=api_key)
+        self.client = AsyncOpenAI(api_key=api_key)
         self.model = model
 
     async def generate_response(
@@ -25,7 +25,8 @@ class OpenAIClient:
         max_tokens: int = 1024,
         temperature: float = 0.7,
         tools: Optional[List[Dict]] = None,
-        tool_choice: str = "auto"
+        tool_choice: str = "auto",
+        on_token: Optional[Callable[[str], None]] = None
     ) -> Dict[str, Any]:
         """Generate a response using OpenAI with optional function calling.
 
@@ -36,6 +37,8 @@ class OpenAIClient:
             temperature: Sampling temperature
             tools: Optional list of tool definitions for function calling
             tool_choice: When to use tools ("auto", "none", or specific function)
+            on_token: Optional callback; if given, the completion is streamed
+                and each content delta is passed to it as it arrives
 
         Returns:
             Dictionary with 'content' and optionally 'tool_calls'
@@ -60,7 +63,10 @@ class OpenAIClient:
                 params["tools"] = tools
                 params["tool_choice"] = tool_choice
 
-            response = self.client.chat.completions.create(**params)
+            if on_token is not None:
+                return await self._stream_completion(params, on_token)
+
+            response = await self.client.chat.completions.create(**params)
             message = response.choices[0].message
 
             result = {
@@ -89,6 +95,45 @@ class OpenAIClient:
             }
 
 
+    async def _stream_completion(self, params: Dict[str, Any], on_token: Callable[[str], None]) -> Dict[str, Any]:
+        """Run a streaming completion, forwarding content deltas to on_token.
+
+        Args:
+            params: chat.completions.create parameters
+            on_token: Callback receiving each content delta
+
+        Returns:
+            Dictionary with 'content' and 'tool_calls' (same shape as generate_response)
+        """
+        stream = await self.client.chat.completions.create(**params, stream=True)
+
+        content_parts = []
+        tool_calls: Dict[int, Dict[str, str]] = {}
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+
+            if delta.content:
+                content_parts.append(delta.content)
+                on_token(delta.content)
+
+            # Tool calls arrive as fragments keyed by index
+            for tc in delta.tool_calls or ():
+                call = tool_calls.setdefault(tc.index, {"id": "", "name": "", "arguments": ""})
+                if tc.id:
+                    call["id"] = tc.id
+                if tc.function and tc.function.name:
+                    call["name"] += tc.function.name
+                if tc.function and tc.function.arguments:
+                    call["arguments"] += tc.function.arguments
+
+        return {
+            "content": "".join(content_parts),
+            "tool_calls": [tool_calls[index] for index in sorted(tool_calls)]
+        }
+
+
 class ClaudeClient:
     """Wrapper for Anthropic Claude API."""
 
@@ -0,0 +1,133 @@
+"""Test GameStatePool recycling: reset() leaves nothing behind, busy states aren't pooled."""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.game_state import GameState, GameStatePool
+
+
+def _play_a_little(game_state: GameState):
+    """Leave traces of a playthrough in every part reset() should clear."""
+    game_state.conversation.add_message("player", "Hello Echo")
+    game_state.update_affinity("echo", 0.4, reason="kind words")
+    game_state.room_progression.puzzle_state.setdefault("room1_clues_found", set()).add("newspaper")
+    game_state.echo_expression = "happy"
+    game_state.state_version = 7
+    game_state._ui_cache["relationships"] = (7, "cached")
+    game_state._last_rel_md = "sent"
+    game_state._last_progress_md = "sent"
+    for companion in game_state.companions.values():
+        companion.memory.add_memory("User: Hello Echo")
+        companion.tool_use_history.append({"tool": "check_story_progress"})
+
+
+def test_reset_clears_playthrough():
+    """A recycled state starts exactly like a fresh one."""
+    print("Testing reset() clears the previous playthrough...")
+    fresh = GameState("fresh-session")
+    game_state = GameState("old-session")
+    _play_a_little(game_state)
+    mcp_client = game_state.mcp_client
+    game_state.voice_enabled = False
+
+    game_state.reset("new-session")
+
+    assert game_state.session_id == "new-session"
+    assert game_state.conversation.session_id == "new-session"
+    assert game_state.conversation.get_messages() == []
+    assert game_state.relationships.get_relationship("player", "echo") == fresh.relationships.get_relationship("player", "echo")
+    assert game_state.relationships_markdown == fresh.relationships_markdown
+    assert game_state.room_progression.current_room_number == fresh.room_progression.current_room_number
+    assert game_state.room_progression.puzzle_state == fresh.room_progression.puzzle_state
+    assert game_state.echo_expression == "neutral"
+    assert game_state.state_version == 0
+    assert game_state._ui_cache == {}
+    assert game_state._last_rel_md is None and game_state._last_progress_md is None
+    for companion_id, companion in game_state.companions.items():
+        assert companion.memory.get_recent_memories() == [], companion_id
+        assert companion.tool_use_history == [], companion_id
+
+    # Clients survive; the voice setting belongs to the UI checkbox, not the playthrough
+    assert game_state.mcp_client is mcp_client
+    assert game_state.voice_enabled is False
+    print("✓ reset() leaves no state from the previous playthrough")
+
+
+def test_pool_recycles_released_state():
+    """acquire() hands back a released state, reset for the new session."""
+    print("Testing pool acquire/release...")
+    pool = GameStatePool(max_size=1)
+    game_state = pool.acquire("session-a")
+    _play_a_little(game_state)
+
+    pool.release(game_state)
+    pool.release(game_state)  # releasing twice must not pool it twice
+    assert len(pool._idle) == 1
+
+    recycled = pool.acquire("session-b")
+    assert recycled is game_state
+    assert recycled.session_id == "session-b"
+    assert recycled.conversation.get_messages() == []
+    assert pool.acquire("session-c") is not game_state
+    print("✓ Released state recycled once, reset for the new session")
+
+
+def test_pool_is_bounded():
+    """Releases beyond max_size are left to the garbage collector."""
+    print("Testing pool bound...")
+    pool = GameStatePool(max_size=1)
+    pool.release(GameState("a"))
+    pool.release(GameState("b"))
+    assert len(pool._idle) == 1
+    print("✓ Pool keeps at most max_size idle states")
+
+
+def test_busy_state_not_pooled():
+    """A state with a turn in flight is never recycled under that turn."""
+    print("Testing busy states are not pooled...")
+    pool = GameStatePool()
+    game_state = GameState("busy-session")
+
+    with game_state.in_use():
+        assert game_state.busy
+        pool.release(game_state)
+    assert pool._idle == []
+    assert not game_state.busy
+
+    pool.release(game_state)
+    assert pool._idle == [game_state]
+    print("✓ Busy state skipped, idle state pooled")
+
+
+def test_warming_up_state_not_pooled():
+    """The background MCP warm-up counts as in flight too."""
+    print("Testing warming-up states are not pooled...")
+
+    async def run():
+        pool = GameStatePool()
+        game_state = GameState("warmup-session")
+        game_state._warmup_task = asyncio.get_running_loop().create_future()
+        assert game_state.busy
+        pool.release(game_state)
+        assert pool._idle == []
+
+        game_state._warmup_task.set_result(None)
+        assert not game_state.busy
+        pool.release(game_state)
+        assert pool._idle == [game_state]
+
+    asyncio.run(run())
+    print("✓ State pooled only after warm-up finished")
+
+
+if __name__ == "__main__":
+    test_reset_clears_playthrough()
+    test_pool_recycles_released_state()
+    test_pool_is_bounded()
+    test_busy_state_not_pooled()
+    test_warming_up_state_not_pooled()
+    print("\n✅ ALL POOL TESTS PASSED!")
@@ -0,0 +1,238 @@
+"""Test MCP tool dispatch: sync/async tools, concurrent read-only calls, streamed tool calls."""
+
+import asyncio
+import json
+import sys
+import os
+import threading
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.companions.agents import OpenAICompanion
+from src.game_mcp.tools import MCPTools
+from src.utils.api_clients import OpenAIClient
+
+
+class _ThreadRecordingTools(MCPTools):
+    """MCPTools with one sync and one async tool that report where they ran."""
+
+    def sync_tool(self, value: int):
+        return {"value": value, "thread": threading.get_ident()}
+
+    async def async_tool(self, value: int):
+        return {"value": value, "thread": threading.get_ident()}
+
+    def failing_tool(self):
+        raise ValueError("boom")
+
+
+def test_call_tool_async():
+    """Async tools run on the caller's loop, sync tools in a worker thread."""
+    print("Testing call_tool_async...")
+    tools = _ThreadRecordingTools(game_state=None)
+
+    async def run():
+        loop_thread = threading.get_ident()
+
+        result = await tools.call_tool_async("async_tool", {"value": 1})
+        assert result["value"] == 1
+        assert result["thread"] == loop_thread
+
+        result = await tools.call_tool_async("sync_tool", {"value": 2})
+        assert result["value"] == 2
+        assert result["thread"] != loop_thread
+
+        # Errors come back as results instead of raising
+        assert await tools.call_tool_async("failing_tool", {}) == {"error": "boom"}
+        assert await tools.call_tool_async("no_such_tool", {}) == {"error": "Tool no_such_tool not found"}
+
+    asyncio.run(run())
+    print("✓ Sync and async tools dispatched correctly")
+
+
+class _FakeMCPClient:
+    """MCP client stand-in that tracks how many calls overlap."""
+
+    def __init__(self, fail: frozenset = frozenset()):
+        self.fail = fail
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+
+    def get_tool_definitions_for_openai(self):
+        return []
+
+    async def call_tool(self, name, arguments):
+        self.calls.append(name)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(0.01)
+            if name in self.fail:
+                raise RuntimeError(f"{name} failed")
+            return {"tool": name}
+        finally:
+            self.running -= 1
+
+
+class _ScriptedClient:
+    """LLM client stand-in returning one canned result per round."""
+
+    def __init__(self, rounds):
+        self.rounds = list(rounds)
+
+    async def generate_response(self, on_token=None, **kwargs):
+        result = self.rounds.pop(0)
+        if on_token is not None and result["content"]:
+            on_token(result["content"])
+        return result
+
+
+def _tool_round(*names):
+    return {
+        "content": "",
+        "tool_calls": [{"id": f"call_{i}", "name": name, "arguments": "{}"} for i, name in enumerate(names)]
+    }
+
+
+def _companion(mcp_client, rounds):
+    companion = OpenAICompanion("echo", "Echo", {}, api_key="test-key", mcp_client=mcp_client)
+    companion._build_personality_prompt = lambda context: ""
+    companion.client = _ScriptedClient(rounds)
+    return companion
+
+
+def test_read_only_tools_run_concurrently():
+    """Several read-only calls in one round overlap; results keep call order."""
+    print("Testing concurrent read-only dispatch...")
+    mcp_client = _FakeMCPClient()
+    companion = _companion(mcp_client, [
+        _tool_round("check_story_progress", "check_relationship_affinity", "check_room_progress"),
+        {"content": "Hello!", "tool_calls": []},
+    ])
+
+    result = asyncio.run(companion.respond("hi"))
+
+    assert result["response"] == "Hello!"
+    assert mcp_client.max_running == 3
+    assert [call["tool"] for call in result["tool_calls_made"]] == [
+        "check_story_progress", "check_relationship_affinity", "check_room_progress"
+    ]
+    assert [call["result"] for call in result["tool_calls_made"]] == [
+        {"tool": "check_story_progress"}, {"tool": "check_relationship_affinity"}, {"tool": "check_room_progress"}
+    ]
+    print("✓ Read-only tools ran together")
+
+
+def test_state_changing_tools_run_in_order():
+    """A round containing a state-changing tool runs its calls one at a time."""
+    print("Testing sequential dispatch...")
+    mcp_client = _FakeMCPClient()
+    companion = _companion(mcp_client, [
+        _tool_round("check_puzzle_trigger", "unlock_next_room"),
+        {"content": "Done.", "tool_calls": []},
+    ])
+
+    asyncio.run(companion.respond("light rain"))
+
+    assert mcp_client.max_running == 1
+    assert mcp_client.calls == ["check_puzzle_trigger", "unlock_next_room"]
+    print("✓ State-changing tools ran sequentially in order")
+
+
+def test_concurrent_failure_matches_sequential():
+    """A failing concurrent call raises its own exception, not an ExceptionGroup."""
+    print("Testing concurrent dispatch errors...")
+    mcp_client = _FakeMCPClient(fail=frozenset({"check_relationship_affinity", "check_room_progress"}))
+    companion = _companion(mcp_client, [
+        _tool_round("check_story_progress", "check_relationship_affinity", "check_room_progress"),
+    ])
+
+    try:
+        asyncio.run(companion.respond("hi"))
+    except RuntimeError as e:
+        assert str(e) == "check_relationship_affinity failed"
+    else:
+        raise AssertionError("expected the first failing tool's exception")
+    print("✓ First failing tool's exception raised")
+
+
+def test_new_round_resets_streamed_text():
+    """on_token gets None before each round after a tool call."""
+    print("Testing on_token round markers...")
+    tokens = []
+    companion = _companion(_FakeMCPClient(), [
+        {"content": "Let me check...", "tool_calls": _tool_round("check_story_progress")["tool_calls"]},
+        {"content": "Hello!", "tool_calls": []},
+    ])
+
+    asyncio.run(companion.respond("hi", on_token=tokens.append))
+
+    assert tokens == ["Let me check...", None, "Hello!"]
+    print("✓ Streamed text reset between rounds")
+
+
+def _chunk(content=None, tool_calls=None):
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+def _tool_delta(index, id=None, name=None, arguments=None):
+    return SimpleNamespace(index=index, id=id, function=SimpleNamespace(name=name, arguments=arguments))
+
+
+class _FakeStream:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+def test_stream_reassembles_tool_calls():
+    """Tool call fragments are joined per index; only content deltas reach on_token."""
+    print("Testing streamed tool call reassembly...")
+    chunks = [
+        SimpleNamespace(choices=[]),
+        _chunk(content="Hi"),
+        _chunk(tool_calls=[_tool_delta(0, id="call_a", name="check_story_", arguments='{"a"')]),
+        _chunk(tool_calls=[_tool_delta(1, id="call_b", name="check_room_progress", arguments="{}")]),
+        _chunk(tool_calls=[_tool_delta(0, name="progress", arguments=': 1}')]),
+        _chunk(content=""),
+        _chunk(content=" there"),
+    ]
+
+    async def create(**params):
+        assert params["stream"] is True
+        return _FakeStream(chunks)
+
+    client = OpenAIClient(api_key="test-key")
+    client.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    tokens = []
+
+    result = asyncio.run(client._stream_completion({"model": client.model, "messages": []}, tokens.append))
+
+    assert tokens == ["Hi", " there"]
+    assert result["content"] == "Hi there"
+    assert result["tool_calls"] == [
+        {"id": "call_a", "name": "check_story_progress", "arguments": '{"a": 1}'},
+        {"id": "call_b", "name": "check_room_progress", "arguments": "{}"},
+    ]
+    assert json.loads(result["tool_calls"][0]["arguments"]) == {"a": 1}
+    print("✓ Tool calls reassembled by index")
+
+
+if __name__ == "__main__":
+    test_call_tool_async()
+    test_read_only_tools_run_concurrently()
+    test_state_changing_tools_run_in_order()
+    test_concurrent_failure_matches_sequential()
+    test_new_round_resets_streamed_text()
+    test_stream_reassembles_tool_calls()
+    print("\n✅ ALL TOOL DISPATCH TESTS PASSED!")